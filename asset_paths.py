@@ -0,0 +1,23 @@
+import os
+
+# Where the icons and logo live, kept free of Qt so headless tools such as
+# the card exporter can find them too. The device keeps its icons at
+# ASSETS_DIR; WIPI_ASSETS_DIR overrides it, and a checkout without the
+# device directory falls back to its own icons/.
+ASSETS_DIR = "/home/pi/wi-pi-demo/icons"
+BUNDLED_ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+
+
+def resolve_assets_dir(environ=os.environ):
+    """Picks the asset directory: WIPI_ASSETS_DIR, then the device path, then the bundled icons."""
+    configured = environ.get("WIPI_ASSETS_DIR")
+    if configured:
+        return configured
+    if os.path.isdir(ASSETS_DIR):
+        return ASSETS_DIR
+    return BUNDLED_ASSETS_DIR
+
+
+def asset_path(name, environ=os.environ):
+    """Returns the path of an asset in the directory resolve_assets_dir picks."""
+    return os.path.join(resolve_assets_dir(environ), name)
@@ -0,0 +1,101 @@
+import os
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QIcon, QImage, QPixmap
+from asset_paths import resolve_assets_dir
+import metrics
+
+# Sizes the screens draw assets at
+LIST_ICON_SIZE = QSize(16, 16)
+BUTTON_ICON_SIZE = QSize(32, 32)
+DASHBOARD_LOGO_SIZE = QSize(150, 75)
+SELECTOR_LOGO_SIZE = QSize(120, 60)
+
+# Every asset the UI uses, with the sizes preload() prepares it at
+ASSET_SIZES = {
+    "lock.png": (LIST_ICON_SIZE,),
+    "unlock.png": (LIST_ICON_SIZE,),
+    "wifi.png": (BUTTON_ICON_SIZE,),
+    "settings.png": (BUTTON_ICON_SIZE,),
+    "wi-pi-logo.png": (DASHBOARD_LOGO_SIZE, SELECTOR_LOGO_SIZE),
+}
+
+
+# Loads each icon and logo from disk once, scales it once per size and
+# hands out the same QPixmap/QIcon to every caller, so building screens and
+# applying scans does no file I/O. Missing files give null pixmaps and
+# empty icons, which callers already treat as "no image".
+class AssetRegistry:
+    def __init__(self, base_dir=None):
+        self.base_dir = base_dir or resolve_assets_dir()
+        try:
+            self.available = set(os.listdir(self.base_dir))
+        except OSError as e:
+            print(f"Error listing assets in {self.base_dir}: {e}")
+            self.available = set()
+        # Full-size images, only kept while preloading several sizes of one file
+        self.sources = {}
+        self.pixmaps = {}
+        self.icons = {}
+
+    def path(self, name):
+        return os.path.join(self.base_dir, name)
+
+    def exists(self, name):
+        return name in self.available
+
+    def source(self, name):
+        image = self.sources.get(name)
+        if image is None:
+            if not self.exists(name):
+                return QImage()
+            with metrics.span("asset.load", asset=name):
+                image = QImage(self.path(name))
+            self.sources[name] = image
+        return image
+
+    def pixmap(self, name, size=None):
+        """Returns the shared pixmap of an asset, smooth-scaled to fit size if given."""
+        key = (name, size.width(), size.height()) if size is not None else (name, 0, 0)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            image = self.source(name)
+            if size is not None and not image.isNull():
+                with metrics.span("asset.scale", asset=name, width=size.width(), height=size.height()):
+                    image = image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap = QPixmap.fromImage(image)
+            self.pixmaps[key] = pixmap
+            metrics.count("asset.pixmaps")
+        return pixmap
+
+    def icon(self, name):
+        """Returns the shared icon of an asset, carrying every size it is drawn at."""
+        icon = self.icons.get(name)
+        if icon is None:
+            icon = QIcon()
+            for size in ASSET_SIZES.get(name, (None,)):
+                pixmap = self.pixmap(name, size)
+                if not pixmap.isNull():
+                    icon.addPixmap(pixmap)
+            self.icons[name] = icon
+        return icon
+
+    def preload(self):
+        """Prepares every known asset at every size it is used at."""
+        with metrics.span("asset.preload"):
+            for name, sizes in ASSET_SIZES.items():
+                for size in sizes:
+                    self.pixmap(name, size)
+                self.icon(name)
+        # Every size the UI asks for is ready; the full-size images are not needed
+        self.sources.clear()
+
+
+_shared_assets = None
+
+
+def shared_assets():
+    """Returns the registry shared by all screens, creating it on first use."""
+    global _shared_assets
+    if _shared_assets is None:
+        _shared_assets = AssetRegistry()
+    return _shared_assets
@@ -0,0 +1,62 @@
+"""
+Measures export_cards throughput for generated network lists of 1k and
+10k rows, and the peak memory of the parent and of the worker processes,
+which should stay flat as the list grows.
+
+    python3 benchmarks/bench_export_cards.py [--sizes 1000,10000] [--format png] [--processes N]
+"""
+import argparse
+import csv
+import os
+import resource
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import export_cards  # noqa: E402
+
+
+def write_networks(path, count):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["wifi_name", "wifi_password"])
+        for i in range(count):
+            writer.writerow([f"Room {i:05d}", f"guest-{i * 7919 % 100000:05d}-pass"])
+
+
+def peak_rss_mb(who):
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--format", choices=export_cards.FORMATS, default="png")
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--logo", default=os.path.join(ROOT, "wi-pi-logo.png"))
+    args = parser.parse_args(argv)
+
+    processes = args.processes or os.cpu_count() or 1
+    print(f"{processes} worker processes, {args.format} cards")
+    print(f"{'cards':>7} {'seconds':>9} {'cards/s':>9} {'parent MB':>10} {'worker MB':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "networks.csv")
+            write_networks(input_path, size)
+            exported, failed, seconds = export_cards.export_cards(
+                input_path, os.path.join(tmp, "cards"), args.format, processes,
+                logo_path=args.logo, quiet=True,
+            )
+        if failed or exported != size:
+            print(f"{size}: only {exported} exported, {failed} failed")
+            return 1
+        print(f"{size:>7} {seconds:>9.1f} {exported / seconds:>9.0f} "
+              f"{peak_rss_mb(resource.RUSAGE_SELF):>10.0f} {peak_rss_mb(resource.RUSAGE_CHILDREN):>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
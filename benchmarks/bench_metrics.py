@@ -0,0 +1,61 @@
+"""
+Measures what the metrics layer costs per call, with metrics off (the
+default on the kiosk) and on, against an uninstrumented baseline.
+
+    python3 benchmarks/bench_metrics.py [--calls N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.pop("WIPI_METRICS", None)
+import metrics  # noqa: E402
+
+
+def work():
+    return sum(range(10))
+
+
+def plain():
+    work()
+
+
+def with_span():
+    with metrics.span("bench.work"):
+        work()
+
+
+def with_count():
+    metrics.count("bench.work")
+    work()
+
+
+def per_call_ns(func, calls):
+    return min(timeit.repeat(func, number=calls, repeat=5)) / calls * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    baseline = per_call_ns(plain, args.calls)
+    print(f"{'mode':<6} {'span ns':>9} {'count ns':>9}  (overhead over a {baseline:.0f} ns baseline)")
+    print(f"{'off':<6} {per_call_ns(with_span, args.calls) - baseline:>9.0f} "
+          f"{per_call_ns(with_count, args.calls) - baseline:>9.0f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fewer calls with metrics on: every span is a line in the log
+        calls = max(1, args.calls // 20)
+        metrics.configure(path=os.path.join(tmp, "metrics.jsonl"))
+        print(f"{'on':<6} {per_call_ns(with_span, calls) - baseline:>9.0f} "
+              f"{per_call_ns(with_count, calls) - baseline:>9.0f}")
+        metrics.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmarks nfc_writer's batch provisioning loop against a fake reader, and
+compares it with reopening the reader for every tag as the one-shot mode does.
+
+    python3 benchmarks/bench_nfc_batch.py [--tags N] [--open-delay S] [--page-delay S]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nfc_writer
+from fake_nfc import FakeFrontend, FakeTag
+
+
+def make_tags(count, octets, page_delay):
+    """Every fifth tag is already provisioned and every tenth write is corrupted."""
+    tags = []
+    for i in range(count):
+        tags.append(FakeTag(
+            octets=octets if i % 5 == 4 else b"",
+            read_delay=page_delay / 2,
+            write_delay=page_delay,
+            corrupt_writes=i % 10 == 7,
+        ))
+    return tags
+
+
+def run_batch(tags, octets):
+    writer = nfc_writer.BatchWriter([octets])
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        writer.run(FakeFrontend(tags))
+        elapsed = time.perf_counter() - start
+    return elapsed, writer
+
+
+def run_one_shot(tags, credentials_path, open_delay):
+    """Re-reads the JSON, re-encodes and reopens the reader for every tag."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for tag in tags:
+            octets = nfc_writer.encode_message(*nfc_writer.load_credentials(credentials_path))
+            time.sleep(open_delay)
+            clf = FakeFrontend([tag])
+            clf.connect(rdwr={'on-connect': lambda t: setattr(t.ndef, "octets", octets) or True})
+            clf.close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tags", type=int, default=200)
+    parser.add_argument("--open-delay", type=float, default=0.05, help="seconds to open the reader")
+    parser.add_argument("--page-delay", type=float, default=0.002, help="seconds per 4-byte page write")
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump({"wifi_name": "Conference Hall", "wifi_password": "correct horse battery"}, f)
+        credentials_path = f.name
+    try:
+        octets = nfc_writer.encode_message(*nfc_writer.load_credentials(credentials_path))
+        wsc_octets = nfc_writer.encode_wsc_message(*nfc_writer.load_credentials(credentials_path))
+        print(f"message size: text record {len(octets)} bytes, WSC record {len(wsc_octets)} bytes")
+
+        elapsed, writer = run_batch(make_tags(args.tags, octets, args.page_delay), octets)
+        print(
+            f"batch:    {args.tags} tags in {elapsed:.2f}s = {args.tags / elapsed * 60:.0f} tags/min "
+            f"({writer.written} written, {writer.skipped} skipped, {writer.failed} failed)"
+        )
+
+        elapsed = run_one_shot(make_tags(args.tags, octets, args.page_delay), credentials_path, args.open_delay)
+        print(f"one-shot: {args.tags} tags in {elapsed:.2f}s = {args.tags / elapsed * 60:.0f} tags/min")
+    finally:
+        os.remove(credentials_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
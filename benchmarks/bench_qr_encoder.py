@@ -0,0 +1,66 @@
+"""
+Compares the stock qrcode fit/mask path with qr_encoder's vectorized path
+for dashboard-style Wi-Fi payloads, and checks the matrices are identical.
+
+    python3 benchmarks/bench_qr_encoder.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import qrcode
+import qr_encoder
+
+NETWORKS = [
+    ("WiPi_Network", "securepass123"),
+    ("Guest", "welcome"),
+    ("Staff-5G", "c0rrect horse battery staple"),
+    ("Conference Hall East Wing", "Xy7!pQ2#lM9@vB4$nK8%zR1^"),
+    ("EVENT_2026", "0123456789012345678901234567890123456789012345678901234567890123"),
+]
+
+
+def stock_matrix(payload, error_correction):
+    qr = qrcode.QRCode(error_correction=error_correction, box_size=10, border=2)
+    qr.add_data(payload)
+    qr.make(fit=True)
+    return qr.modules
+
+
+def time_per_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    error_correction = qrcode.constants.ERROR_CORRECT_M
+    print(f"{'SSID':<28}{'ver':>4}{'stock ms':>10}{'fast ms':>10}{'speedup':>9}")
+    for ssid, password in NETWORKS:
+        payload = qr_encoder.wifi_qr_payload(ssid, password)
+        fast = qr_encoder.encode(payload, error_correction)
+        if not np.array_equal(fast, np.array(stock_matrix(payload, error_correction), dtype=bool)):
+            print(f"MISMATCH for {ssid!r}")
+            return 1
+
+        stock_time = time_per_call(lambda: stock_matrix(payload, error_correction), args.repeat)
+        fast_time = time_per_call(lambda: qr_encoder.encode(payload, error_correction), args.repeat)
+        version = (fast.shape[0] - 17) // 4
+        print(
+            f"{ssid:<28}{version:>4}{stock_time * 1000:>10.2f}"
+            f"{fast_time * 1000:>10.2f}{stock_time / fast_time:>8.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Measures cold start of the kiosk entry points in fresh interpreters: time
+to import the entry module, to build its window and to its first painted
+frame, and fails if the median time to first paint is over budget.
+
+    QT_QPA_PLATFORM=offscreen python3 benchmarks/bench_startup.py [--runs N] [--output FILE]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median milliseconds from process spawn to first paint, sized for a Pi 4
+STARTUP_BUDGET_MS = {
+    "wifi_selector_gui": 2500,
+    "main_screen": 3500,
+}
+
+RESULT_MARKER = "STARTUP_RESULT "
+
+CHILD = r"""
+import json, sys, time
+started = time.time()
+t0 = time.perf_counter()
+import importlib
+from PyQt5.QtWidgets import QApplication
+entry = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+app = QApplication(sys.argv[:1])
+window = entry.create_window()
+built = time.perf_counter()
+window.show()
+
+from startup import after_first_paint
+
+def painted():
+    now = time.perf_counter()
+    print(%r + json.dumps({
+        "started": started,
+        "import_ms": (imported - t0) * 1000,
+        "build_ms": (built - imported) * 1000,
+        "first_paint_ms": (now - t0) * 1000,
+        "modules": len(sys.modules),
+        "heavy": sorted(m for m in ("numpy", "qrcode", "PIL") if m in sys.modules),
+    }), flush=True)
+    app.quit()
+
+after_first_paint(window, painted)
+app.exec_()
+""" % RESULT_MARKER
+
+
+def measure(entry):
+    spawned = time.time()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, entry],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=True,
+        timeout=60,
+    ).stdout.decode(errors="ignore")
+    for line in output.splitlines():
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+            interpreter_ms = (result.pop("started") - spawned) * 1000
+            result["interpreter_ms"] = interpreter_ms
+            result["total_ms"] = interpreter_ms + result["first_paint_ms"]
+            return result
+    raise RuntimeError(f"{entry} did not report a first paint")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="write the medians to this JSON file")
+    parser.add_argument("--no-budget", action="store_true", help="report only, never fail")
+    args = parser.parse_args()
+
+    report = {}
+    over_budget = []
+    print(f"{'entry':<20}{'interp':>9}{'import':>9}{'build':>9}{'paint':>9}{'total':>9}  heavy modules")
+    for entry, budget in STARTUP_BUDGET_MS.items():
+        runs = [measure(entry) for _ in range(args.runs)]
+        medians = {
+            key: statistics.median(run[key] for run in runs)
+            for key in ("interpreter_ms", "import_ms", "build_ms", "first_paint_ms", "total_ms")
+        }
+        medians["heavy"] = runs[-1]["heavy"]
+        report[entry] = medians
+        print(
+            f"{entry:<20}{medians['interpreter_ms']:>9.0f}{medians['import_ms']:>9.0f}"
+            f"{medians['build_ms']:>9.0f}{medians['first_paint_ms']:>9.0f}"
+            f"{medians['total_ms']:>9.0f}  {', '.join(medians['heavy']) or '-'}"
+        )
+        if medians["total_ms"] > budget:
+            over_budget.append(f"{entry}: {medians['total_ms']:.0f} ms > {budget} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if over_budget and not args.no_budget:
+        print("Over startup budget:\n  " + "\n  ".join(over_budget))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
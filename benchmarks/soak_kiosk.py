@@ -0,0 +1,215 @@
+"""
+Soak test for the kiosk shell: drives thousands of scan / select / QR render
+cycles through WifiManager under the offscreen Qt platform with a fake
+nmcli, and fails if RSS, live widgets or live pixmaps keep growing.
+
+    QT_QPA_PLATFORM=offscreen python3 benchmarks/soak_kiosk.py [--cycles N] [--sample-every N]
+
+Every run uses a scratch directory for the selected network, the scan
+snapshot and the QR cache, so nothing on the device is touched.
+"""
+import argparse
+import gc
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer  # noqa: E402
+from PyQt5.QtGui import QPixmap  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+# Growth allowed between the end of warm-up and the end of the run
+RSS_BUDGET_MB = 25
+WIDGET_BUDGET = 0
+PIXMAP_BUDGET = 16
+
+WARMUP_CYCLES = 50
+STEP_TIMEOUT_S = 10
+# Every this many cycles the dashboard gets several networks to rotate through
+ROTATION_EVERY = 10
+
+SSIDS = [f"Venue-{i:02d}" for i in range(30)]
+
+
+def nmcli_output(cycle):
+    """A scan that changes from cycle to cycle: networks come and go and signals move."""
+    rng = random.Random(cycle)
+    lines = []
+    for ssid in rng.sample(SSIDS, rng.randint(8, 20)):
+        security = "" if ssid.endswith(("0", "5")) else "WPA2"
+        bssid = "AA\\:BB\\:CC\\:DD\\:EE\\:%02X" % SSIDS.index(ssid)
+        lines.append(f"{ssid}:{security}:{rng.randint(10, 99)}:{bssid}:6:2437 MHz")
+    return ("\n".join(lines) + "\n").encode()
+
+
+class FakeNmcli:
+    """Answers nmcli with the current cycle's scan."""
+
+    def __init__(self):
+        self.cycle = 0
+        self.scans = 0
+
+    def __call__(self, args):
+        from fake_process import FakeResponse
+        self.scans += 1
+        return FakeResponse(stdout=nmcli_output(self.cycle))
+
+
+def wait_for(predicate, what):
+    deadline = time.monotonic() + STEP_TIMEOUT_S
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"timed out waiting for {what}")
+        QCoreApplication.processEvents(QEventLoop.AllEvents, 20)
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def live_pixmaps():
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, QPixmap))
+
+
+def sample(app):
+    gc.collect()
+    return {
+        "rss_mb": rss_mb(),
+        "widgets": len(app.allWidgets()),
+        "pixmaps": live_pixmaps(),
+    }
+
+
+class Soak:
+    def __init__(self, scratch):
+        import credential_store
+        import wifi_selector_gui
+        from command_runner import CommandRunner, set_shared_runner
+        from fake_process import FakeProcessFactory
+
+        self.nmcli = FakeNmcli()
+        self.processes = FakeProcessFactory({"nmcli": self.nmcli})
+        set_shared_runner(CommandRunner(self.processes))
+        self.store = credential_store.CredentialStore(os.path.join(scratch, "selected_network.json"))
+        credential_store.set_shared_store(self.store)
+        # Point the screens' scan snapshot and QR cache at the scratch directory
+        os.environ["WIPI_SCAN_SNAPSHOT"] = os.path.join(scratch, "scan_snapshot.json")
+        os.environ["WIPI_QR_CACHE_DIR"] = os.path.join(scratch, "qr")
+
+        self.window = wifi_selector_gui.create_window()
+        self.window.show()
+        self.selector = self.window.selector_screen
+        wait_for(lambda: self.selector.network_model.rowCount() > 0, "the first scan")
+
+    def scan(self, cycle):
+        self.nmcli.cycle = cycle
+        # The fake records every call; only the kiosk's own growth is of interest
+        self.processes.calls.clear()
+        scans = self.nmcli.scans
+        self.selector.scan_networks()
+        wait_for(lambda: not self.selector.scan_service.in_flight and self.nmcli.scans > scans, "a rescan")
+
+    def select(self, cycle):
+        model = self.selector.network_model
+        row = cycle % model.rowCount()
+        ssid = model.networks[row].ssid
+        password = f"pass-{cycle:06d}"
+
+        def answer_prompt():
+            prompt = self.selector.password_prompt
+            prompt.password_input.setText(password)
+            prompt.accept()
+
+        if model.networks[row].secured:
+            # The prompt runs a nested event loop; answer it from inside
+            QTimer.singleShot(0, answer_prompt)
+        else:
+            password = ""
+        self.selector.select_network(model.index(row))
+        wait_for(lambda: self.window.stacked_widget.currentWidget() is self.window._dashboard_screen
+                 and self.window.dashboard_screen.ssid_label.text() == f"Network: {ssid}",
+                 f"the dashboard for {ssid}")
+
+    def rotate(self, cycle):
+        networks = [(f"Rotate-{cycle}-{i}", f"rotate-{cycle:06d}-{i}") for i in range(4)]
+        self.store.save_networks(networks)
+        dashboard = self.window.dashboard_screen
+        for index in range(1, len(networks)):
+            dashboard.show_next()
+            wait_for(lambda: dashboard.ssid_label.text() == f"Network: {networks[index][0]}",
+                     "the next rotation frame")
+
+    def back_to_selector(self):
+        self.window.show_login()
+        self.window.show_selector()
+
+    def cycle(self, cycle):
+        self.scan(cycle)
+        self.select(cycle)
+        if cycle % ROTATION_EVERY == 0:
+            self.rotate(cycle)
+        self.back_to_selector()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--sample-every", type=int, default=250)
+    parser.add_argument("--top", type=int, default=10, help="tracemalloc allocators to list")
+    parser.add_argument("--no-budget", action="store_true", help="report growth without failing")
+    args = parser.parse_args(argv)
+
+    app = QApplication(sys.argv[:1])
+    scratch = tempfile.TemporaryDirectory()
+    soak = Soak(scratch.name)
+
+    for cycle in range(WARMUP_CYCLES):
+        soak.cycle(cycle)
+    baseline = sample(app)
+    tracemalloc.start()
+    first_snapshot = tracemalloc.take_snapshot()
+
+    print(f"{'cycle':>7} {'RSS MB':>8} {'widgets':>8} {'pixmaps':>8} {'cycles/s':>9}")
+    print(f"{0:>7} {baseline['rss_mb']:>8.1f} {baseline['widgets']:>8} {baseline['pixmaps']:>8}")
+    started = time.monotonic()
+    for done in range(1, args.cycles + 1):
+        soak.cycle(WARMUP_CYCLES + done)
+        if done % args.sample_every == 0 or done == args.cycles:
+            current = sample(app)
+            rate = done / (time.monotonic() - started)
+            print(f"{done:>7} {current['rss_mb']:>8.1f} {current['widgets']:>8} "
+                  f"{current['pixmaps']:>8} {rate:>9.1f}")
+
+    last_snapshot = tracemalloc.take_snapshot()
+    print(f"\nTop {args.top} Python allocation growth since warm-up:")
+    for stat in last_snapshot.compare_to(first_snapshot, "lineno")[:args.top]:
+        print(f"  {stat}")
+    tracemalloc.stop()
+
+    growth = {key: current[key] - baseline[key] for key in baseline}
+    budget = {"rss_mb": RSS_BUDGET_MB, "widgets": WIDGET_BUDGET, "pixmaps": PIXMAP_BUDGET}
+    over = [key for key in budget if growth[key] > budget[key]]
+    print("\nGrowth: " + ", ".join(f"{key} {growth[key]:+.1f} (budget {budget[key]})" for key in budget))
+
+    soak.window.dashboard_screen.frames.wait()
+    soak.window.close()
+    scratch.cleanup()
+    if over and not args.no_budget:
+        print(f"Over budget: {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+from typing import NamedTuple, Optional
+from PyQt5.QtCore import QCoreApplication, QObject, QProcess, QTimer
+
+
+# Outcome of a command, always delivered on the GUI thread.
+class CommandResult(NamedTuple):
+    args: list
+    exit_code: int
+    stdout: bytes
+    stderr: bytes
+    error: Optional[str] = None
+    timed_out: bool = False
+    cancelled: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None and not self.timed_out and not self.cancelled and self.exit_code == 0
+
+
+# One running command. Collects its output, enforces the timeout and calls
+# on_finished exactly once, whichever way the command ends.
+class CommandHandle(QObject):
+    def __init__(self, runner, process, args, on_finished, on_output, timeout_ms):
+        super().__init__(runner)
+        self.runner = runner
+        self.process = process
+        self.args = list(args)
+        self.on_finished = on_finished
+        self.on_output = on_output
+        self.stdout = bytearray()
+        self.done = False
+        self.timed_out = False
+        self.cancelled = False
+
+        process.readyReadStandardOutput.connect(self.read_output)
+        process.finished.connect(self.process_finished)
+        process.errorOccurred.connect(self.process_error)
+
+        self.timer = None
+        if timeout_ms:
+            self.timer = QTimer(self)
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self.expire)
+            self.timer.start(timeout_ms)
+
+    @property
+    def running(self):
+        return not self.done
+
+    def start(self):
+        self.process.start(self.args[0], self.args[1:])
+
+    def cancel(self):
+        """Stops the command; on_finished is called with cancelled=True."""
+        if self.done:
+            return
+        self.cancelled = True
+        self.process.kill()
+
+    def expire(self):
+        if self.done:
+            return
+        print(f"Command timed out: {' '.join(self.args)}")
+        self.timed_out = True
+        self.process.kill()
+
+    def read_output(self):
+        chunk = bytes(self.process.readAllStandardOutput())
+        if not chunk:
+            return
+        self.stdout += chunk
+        if self.on_output:
+            self.on_output(chunk)
+
+    def process_finished(self, exit_code, exit_status):
+        self.read_output()
+        self.complete(exit_code, None)
+
+    def process_error(self, error):
+        # Other errors are followed by finished(); a failed start is not
+        if error == QProcess.FailedToStart:
+            self.complete(-1, self.process.errorString())
+
+    def detach(self):
+        """Kills the command without reporting back, for application shutdown."""
+        if self.done:
+            return
+        self.done = True
+        if self.timer:
+            self.timer.stop()
+        # QProcess emits signals from its destructor; make sure none reach us
+        self.process.readyReadStandardOutput.disconnect(self.read_output)
+        self.process.finished.disconnect(self.process_finished)
+        self.process.errorOccurred.disconnect(self.process_error)
+        self.process.kill()
+        self.process.waitForFinished(1000)
+
+    def complete(self, exit_code, error):
+        if self.done:
+            return
+        self.done = True
+        if self.timer:
+            self.timer.stop()
+        result = CommandResult(
+            args=self.args,
+            exit_code=exit_code,
+            stdout=bytes(self.stdout),
+            stderr=bytes(self.process.readAllStandardError()),
+            error=error,
+            timed_out=self.timed_out,
+            cancelled=self.cancelled,
+        )
+        if self.on_finished:
+            self.on_finished(result)
+        self.process.deleteLater()
+        self.deleteLater()
+        self.runner.forget(self)
+
+
+# Runs external commands without blocking the event loop. Every external
+# call in the UI goes through here; tests and benchmarks can swap in
+# fake_process.FakeProcessFactory instead of QProcess.
+class CommandRunner(QObject):
+    def __init__(self, process_factory=None, parent=None):
+        super().__init__(parent)
+        self.process_factory = process_factory or QProcess
+        self.handles = set()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def run(self, args, on_finished=None, on_output=None, timeout_ms=None):
+        """
+        Starts args[0] with the remaining arguments and returns its handle.
+        on_output gets stdout chunks as they arrive; on_finished gets a
+        CommandResult. Both are called on the GUI thread.
+        """
+        process = self.process_factory(self)
+        handle = CommandHandle(self, process, args, on_finished, on_output, timeout_ms)
+        self.handles.add(handle)
+        handle.start()
+        return handle
+
+    def forget(self, handle):
+        self.handles.discard(handle)
+
+    def shutdown(self):
+        """Kills every running command when the application quits."""
+        for handle in list(self.handles):
+            handle.detach()
+        self.handles.clear()
+
+
+_shared_runner = None
+
+
+def shared_runner():
+    """Returns the runner shared by all screens, creating it on first use."""
+    global _shared_runner
+    if _shared_runner is None:
+        _shared_runner = CommandRunner()
+    return _shared_runner
+
+
+def set_shared_runner(runner):
+    """Replaces the shared runner, e.g. with one backed by fake processes."""
+    global _shared_runner
+    _shared_runner = runner
@@ -0,0 +1,158 @@
+import os
+import json
+import stat
+import tempfile
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+SELECTED_NETWORK_PATH = "/home/pi/wi-pi-demo/selected_network.json"
+DEFAULT_NETWORK = ("WiPi_Network", "securepass123")
+# Editors and other tools often touch a file several times in a row
+CHANGE_DEBOUNCE_MS = 100
+
+
+def new_file_mode(path):
+    """
+    Returns the permissions a replacement for path should get: those of
+    the existing file, or what open() would give a new one.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+# Reads and writes the selected network. Writes go to a temporary file
+# that is renamed over the real one, so readers never see half a file, and
+# changes from this process or any other are announced through
+# `networks_changed`.
+class CredentialStore(QObject):
+    # Emitted with the full list of (wifi_name, wifi_password) when any of them change
+    networks_changed = pyqtSignal(list)
+
+    def __init__(self, path=SELECTED_NETWORK_PATH, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.current_networks = None
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(CHANGE_DEBOUNCE_MS)
+        self.debounce.timeout.connect(self.reload)
+
+        # Watch the directory too: an atomic rename replaces the file, which
+        # drops it from the watcher's file list
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.schedule_reload)
+        self.watcher.fileChanged.connect(self.schedule_reload)
+        self.watch_paths()
+
+    def watch_paths(self):
+        watched = set(self.watcher.files() + self.watcher.directories())
+        for path in (os.path.dirname(self.path), self.path):
+            if path not in watched and os.path.exists(path):
+                self.watcher.addPath(path)
+
+    def read(self):
+        """
+        Reads every network in the file, the selected one first. A file
+        with a "networks" list rotates through all of them; an older file
+        with just wifi_name/wifi_password holds a single network. Returns
+        None if the file is missing or cannot be parsed.
+        """
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            entries = data.get("networks") or [data]
+            networks = [(entry["wifi_name"], entry["wifi_password"]) for entry in entries]
+        except Exception as e:
+            print(f"Error loading selected network: {e}")
+            return None
+        return networks
+
+    def load_networks(self):
+        """
+        Loads every network the dashboard should show, the selected one
+        first. If the file cannot be read, the networks already loaded are
+        kept; the default network is only used when there are none yet.
+        """
+        networks = self.read() or self.current_networks or [DEFAULT_NETWORK]
+        self.current_networks = networks
+        return networks
+
+    def save(self, ssid, password):
+        """Atomically replaces the selection with one network. Returns False on failure."""
+        return self.save_networks([(ssid, password)])
+
+    def save_networks(self, networks):
+        """
+        Atomically replaces the networks the dashboard rotates through. The
+        first one is also written as wifi_name/wifi_password for readers that
+        only know about a single network. Returns False on failure.
+        """
+        ssid, password = networks[0]
+        wifi_data = {
+            "wifi_name": ssid,
+            "wifi_password": password,
+        }
+        if len(networks) > 1:
+            wifi_data["networks"] = [
+                {"wifi_name": name, "wifi_password": key} for name, key in networks
+            ]
+        directory = os.path.dirname(self.path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".selected_network.")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    # mkstemp files are 0600; keep the file readable by other tools
+                    os.fchmod(f.fileno(), new_file_mode(self.path))
+                    json.dump(wifi_data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            print(f"Error saving network info: {e}")
+            return False
+
+        self.watch_paths()
+        self.publish([tuple(network) for network in networks])
+        return True
+
+    def schedule_reload(self, path):
+        self.debounce.start()
+
+    def reload(self):
+        """Re-reads the file after a change on disk and publishes it if it differs."""
+        self.watch_paths()
+        if not os.path.exists(self.path):
+            return
+        networks = self.read()
+        # A half-written edit from another tool; wait for the next change
+        if networks is None:
+            return
+        self.publish(networks)
+
+    def publish(self, networks):
+        if networks != self.current_networks:
+            self.current_networks = networks
+            self.networks_changed.emit(networks)
+
+
+_shared_store = None
+
+
+def shared_store():
+    """Returns the store shared by all screens, creating it on first use."""
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = CredentialStore()
+    return _shared_store
+
+
+def set_shared_store(store):
+    """Replaces the shared store, e.g. with one backed by a scratch file."""
+    global _shared_store
+    _shared_store = store
@@ -0,0 +1,296 @@
+import os
+import re
+import io
+import csv
+import sys
+import json
+import time
+import base64
+import argparse
+import threading
+from multiprocessing import Pool
+from xml.sax.saxutils import escape
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from asset_paths import asset_path
+from qr_encoder import encode_wifi
+from qr_render import qr_layout, qr_matrix_pixels
+from qr_settings import QR_ERROR_CORRECTION, QR_BORDER
+
+# Headless export of printable "scan to join" cards: the dashboard's QR
+# code, the SSID and the Wi-Fi Pi logo, as PNG and/or SVG. Networks are
+# streamed from a CSV or JSON-lines file and rendered on a process pool.
+#
+#     python3 export_cards.py rooms.csv --out cards --format both
+#
+# CSV files need a header with wifi_name,wifi_password (or ssid,password);
+# JSON-lines files hold one object per line with the same keys.
+
+# The same logo the dashboard shows; WIPI_ASSETS_DIR points both elsewhere
+LOGO_PATH = asset_path("wi-pi-logo.png")
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+FORMATS = ("png", "svg", "both")
+
+# Card layout in pixels (PNG) or user units (SVG)
+CARD_WIDTH = 600
+CARD_HEIGHT = 860
+CARD_MARGIN = 40
+QR_BOX = 520
+HEADER_SIZE = 34
+LABEL_SIZE = 28
+MIN_LABEL_SIZE = 14
+LOGO_SIZE = (150, 75)
+# zlib level for card PNGs; compression dominates the cost of a card, and
+# below 3 files grow without getting much faster
+PNG_COMPRESS_LEVEL = 3
+
+# Networks handed to a worker at a time, and how many may be in flight per
+# worker; this bounds memory however long the input file is
+CHUNKSIZE = 16
+IN_FLIGHT_PER_WORKER = 4
+PROGRESS_EVERY = 1000
+
+
+def network_fields(entry):
+    """Returns (ssid, password) from a CSV row or JSON object, or raises ValueError."""
+    ssid = entry.get("wifi_name", entry.get("ssid"))
+    password = entry.get("wifi_password", entry.get("password", ""))
+    if not ssid:
+        raise ValueError("missing wifi_name/ssid")
+    return str(ssid), str(password or "")
+
+
+def read_networks(path):
+    """
+    Yields (line, ssid, password, error) for each network in a CSV or
+    JSON-lines file, reading one line at a time. Rows that cannot be used
+    come back with an error message instead of credentials.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".json", ".ndjson")):
+            for line, text in enumerate(f, 1):
+                if not text.strip():
+                    continue
+                try:
+                    yield (line, *network_fields(json.loads(text)), None)
+                except (ValueError, AttributeError) as e:
+                    yield line, None, None, str(e)
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                try:
+                    yield (reader.line_num, *network_fields(row), None)
+                except ValueError as e:
+                    yield reader.line_num, None, None, str(e)
+
+
+def card_name(line, ssid):
+    """Builds a file name that is unique per input line and safe on any filesystem."""
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", ssid).strip("._")[:40] or "network"
+    return f"{line:06d}_{slug}"
+
+
+# Per-worker state, set up once by init_worker
+_worker = {}
+
+
+def load_logo(path):
+    try:
+        with Image.open(path) as image:
+            logo = image.convert("RGBA")
+        logo.thumbnail(LOGO_SIZE, Image.LANCZOS)
+        return logo
+    except Exception as e:
+        print(f"Cards will have no logo: {e}")
+        return None
+
+
+def init_worker(out_dir, formats, logo_path):
+    """Loads and scales the logo once per worker process."""
+    logo = load_logo(logo_path) if logo_path else None
+    logo_uri = None
+    if logo is not None:
+        buffer = io.BytesIO()
+        logo.save(buffer, "PNG")
+        logo_uri = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    _worker.update(out_dir=out_dir, formats=formats, logo=logo, logo_uri=logo_uri, fonts={})
+
+
+def font(size):
+    fonts = _worker.setdefault("fonts", {})
+    if size not in fonts:
+        try:
+            fonts[size] = ImageFont.truetype(FONT_PATH, size)
+        except OSError:
+            fonts[size] = ImageFont.load_default(size=size)
+    return fonts[size]
+
+
+def fitted_font(draw, text, size):
+    """Shrinks the font until text fits between the card margins."""
+    while size > MIN_LABEL_SIZE and draw.textlength(text, font=font(size)) > CARD_WIDTH - 2 * CARD_MARGIN:
+        size -= 2
+    return font(size)
+
+
+def card_template():
+    """
+    Draws the parts every card shares, once per worker. Cards without a
+    logo are grayscale, which makes their PNGs much quicker to compress.
+    """
+    logo = _worker.get("logo")
+    card = Image.new("RGB" if logo is not None else "L", (CARD_WIDTH, CARD_HEIGHT), "white")
+    draw = ImageDraw.Draw(card)
+    draw.text((CARD_WIDTH // 2, CARD_MARGIN), "Scan to Join Wi-Fi", fill="black",
+              font=font(HEADER_SIZE), anchor="mt")
+    if logo is not None:
+        position = ((CARD_WIDTH - logo.width) // 2, CARD_HEIGHT - CARD_MARGIN - logo.height)
+        card.paste(logo, position, logo)
+    return card
+
+
+def render_png(modules, ssid):
+    if "template" not in _worker:
+        _worker["template"] = card_template()
+    card = _worker["template"].copy()
+    draw = ImageDraw.Draw(card)
+
+    qr = Image.fromarray(qr_matrix_pixels(modules, QR_BOX, QR_BORDER), "L")
+    qr_top = CARD_MARGIN + HEADER_SIZE + 30
+    card.paste(qr, ((CARD_WIDTH - qr.width) // 2, qr_top))
+
+    label = f"Network: {ssid}"
+    label_top = qr_top + QR_BOX + 30
+    draw.text((CARD_WIDTH // 2, label_top), label, fill="black",
+              font=fitted_font(draw, label, LABEL_SIZE), anchor="mt")
+    return card
+
+
+def svg_path(modules):
+    """Draws the dark modules as one path of horizontal runs, in module units."""
+    parts = []
+    for y, row in enumerate(modules):
+        # Run boundaries are where the row changes colour
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], row, [False])).astype(np.int8)))
+        for start, end in zip(edges[::2], edges[1::2]):
+            parts.append(f"M{start + QR_BORDER} {y + QR_BORDER}h{end - start}v1h{start - end}z")
+    return "".join(parts)
+
+
+def render_svg(modules, ssid):
+    count, scale = qr_layout(modules.shape[0], QR_BOX, QR_BORDER)
+    side = count * scale
+    qr_left = (CARD_WIDTH - side) // 2
+    qr_top = CARD_MARGIN + HEADER_SIZE + 30
+    label_top = qr_top + QR_BOX + 30
+    label = f"Network: {ssid}"
+    # Long SSIDs are squeezed between the margins instead of running off the card
+    fit = ""
+    if len(label) * LABEL_SIZE * 0.6 > CARD_WIDTH - 2 * CARD_MARGIN:
+        fit = f' textLength="{CARD_WIDTH - 2 * CARD_MARGIN}" lengthAdjust="spacingAndGlyphs"'
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{CARD_WIDTH}" height="{CARD_HEIGHT}" '
+        f'viewBox="0 0 {CARD_WIDTH} {CARD_HEIGHT}">',
+        f'<rect width="{CARD_WIDTH}" height="{CARD_HEIGHT}" fill="#fff"/>',
+        f'<text x="{CARD_WIDTH // 2}" y="{CARD_MARGIN + HEADER_SIZE}" font-family="DejaVu Sans, Arial, sans-serif" '
+        f'font-weight="bold" font-size="{HEADER_SIZE}" text-anchor="middle">Scan to Join Wi-Fi</text>',
+        f'<g transform="translate({qr_left} {qr_top}) scale({scale})">'
+        f'<rect width="{count}" height="{count}" fill="#fff"/>'
+        f'<path d="{svg_path(modules)}" fill="#000" shape-rendering="crispEdges"/></g>',
+        f'<text x="{CARD_WIDTH // 2}" y="{label_top + LABEL_SIZE}" font-family="DejaVu Sans, Arial, sans-serif" '
+        f'font-weight="bold" font-size="{LABEL_SIZE}" text-anchor="middle"{fit}>{escape(label)}</text>',
+    ]
+    logo = _worker.get("logo")
+    if logo is not None:
+        lines.append(
+            f'<image x="{(CARD_WIDTH - logo.width) // 2}" y="{CARD_HEIGHT - CARD_MARGIN - logo.height}" '
+            f'width="{logo.width}" height="{logo.height}" href="{_worker["logo_uri"]}"/>'
+        )
+    lines.append("</svg>\n")
+    return "\n".join(lines)
+
+
+def export_card(job):
+    """Renders one network's card in the worker. Returns (line, paths, error)."""
+    line, ssid, password = job
+    try:
+        modules = encode_wifi(ssid, password, QR_ERROR_CORRECTION)
+        base = os.path.join(_worker["out_dir"], card_name(line, ssid))
+        paths = []
+        if _worker["formats"] in ("png", "both"):
+            render_png(modules, ssid).save(f"{base}.png", compress_level=PNG_COMPRESS_LEVEL)
+            paths.append(f"{base}.png")
+        if _worker["formats"] in ("svg", "both"):
+            with open(f"{base}.svg", "w", encoding="utf-8") as f:
+                f.write(render_svg(modules, ssid))
+            paths.append(f"{base}.svg")
+        return line, paths, None
+    except Exception as e:
+        return line, [], str(e)
+
+
+def export_cards(input_path, out_dir, formats="png", processes=None, logo_path=LOGO_PATH,
+                 chunksize=CHUNKSIZE, quiet=False):
+    """
+    Exports a card for every network in input_path. Returns
+    (exported, failed, seconds).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    processes = processes or os.cpu_count() or 1
+    exported = failed = 0
+    started = time.monotonic()
+
+    # The pool's feeder thread would otherwise read the whole input up
+    # front; each finished card frees a slot for the next network
+    slots = threading.Semaphore(processes * chunksize * IN_FLIGHT_PER_WORKER)
+
+    # Runs on the pool's feeder thread, so it keeps its own count
+    unreadable = 0
+
+    def jobs():
+        nonlocal unreadable
+        for line, ssid, password, error in read_networks(input_path):
+            if error:
+                print(f"Line {line}: {error}")
+                unreadable += 1
+                continue
+            slots.acquire()
+            yield line, ssid, password
+
+    with Pool(processes, initializer=init_worker, initargs=(out_dir, formats, logo_path)) as pool:
+        for line, paths, error in pool.imap_unordered(export_card, jobs(), chunksize):
+            slots.release()
+            if error:
+                print(f"Line {line}: {error}")
+                failed += 1
+                continue
+            exported += 1
+            if not quiet and exported % PROGRESS_EVERY == 0:
+                elapsed = time.monotonic() - started
+                print(f" {exported} cards ({exported / elapsed:.0f} cards/s)")
+
+    return exported, failed + unreadable, time.monotonic() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export printable Wi-Fi QR cards without the GUI.")
+    parser.add_argument("input", help="CSV or JSON-lines file of networks")
+    parser.add_argument("--out", default="cards", help="directory to write the cards to")
+    parser.add_argument("--format", choices=FORMATS, default="png", help="card format to write")
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--logo", default=LOGO_PATH, help="logo to print at the bottom of each card")
+    parser.add_argument("--no-logo", action="store_true", help="leave the logo off")
+    args = parser.parse_args(argv)
+
+    exported, failed, seconds = export_cards(
+        args.input, args.out, args.format, args.processes,
+        logo_path=None if args.no_logo else args.logo,
+    )
+    rate = exported / seconds if seconds else 0.0
+    print(f"Exported {exported} cards to {args.out} in {seconds:.1f}s ({rate:.0f} cards/s), {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
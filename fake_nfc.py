@@ -0,0 +1,82 @@
+import time
+
+# Stand-ins for nfcpy's ContactlessFrontend and Type 2 tags, so the batch
+# provisioning loop can run and be benchmarked without a reader attached.
+
+# Type 2 tags are written in 4-byte pages
+PAGE_SIZE = 4
+
+
+class FakeNDEF:
+    def __init__(self, tag, octets=b"", capacity=137, writeable=True):
+        self.tag = tag
+        self._data = bytes(octets)
+        self._written = None
+        self.capacity = capacity
+        self.is_writeable = writeable
+
+    @property
+    def octets(self):
+        self.tag.pause(len(self._data))
+        return self._data
+
+    @octets.setter
+    def octets(self, data):
+        if not self.is_writeable:
+            raise AttributeError("tag ndef area is not writeable")
+        if len(data) > self.capacity:
+            raise ValueError("data length exceeds tag capacity")
+        self.tag.pause(len(data), writing=True)
+        self.tag.writes += 1
+        self._written = bytes(data)
+        self._data = self.tag.corrupt(bytes(data))
+
+    @property
+    def has_changed(self):
+        self.tag.pause(len(self._data))
+        return self._data != self._written
+
+
+class FakeTag:
+    """
+    A tag with an NDEF area. read_delay and write_delay are seconds per
+    page; corrupt_writes makes writes store something else, to exercise
+    read-back verification.
+    """
+
+    def __init__(self, octets=b"", capacity=137, writeable=True, read_delay=0.0,
+                 write_delay=0.0, corrupt_writes=False):
+        self.read_delay = read_delay
+        self.write_delay = write_delay
+        self.corrupt_writes = corrupt_writes
+        self.writes = 0
+        self.ndef = FakeNDEF(self, octets, capacity, writeable)
+
+    def pause(self, length, writing=False):
+        delay = self.write_delay if writing else self.read_delay
+        if delay:
+            time.sleep(delay * -(-length // PAGE_SIZE))
+
+    def corrupt(self, data):
+        return data[:-1] + b"\0" if self.corrupt_writes and data else data
+
+
+class FakeFrontend:
+    """Presents the given tags one at a time, then stops like a closed reader."""
+
+    def __init__(self, tags):
+        self.tags = iter(tags)
+        self.opened = 1
+        self.closed = False
+
+    def connect(self, rdwr=None, terminate=lambda: False):
+        if terminate():
+            return None
+        tag = next(self.tags, None)
+        if tag is None:
+            return None
+        rdwr['on-connect'](tag)
+        return True
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,83 @@
+from typing import NamedTuple
+from PyQt5.QtCore import QObject, QProcess, QTimer, pyqtSignal
+
+
+# Canned behaviour for one fake command.
+class FakeResponse(NamedTuple):
+    stdout: bytes = b""
+    stderr: bytes = b""
+    exit_code: int = 0
+    delay_ms: int = 0
+
+
+# Stand-in for the parts of QProcess that command_runner uses. It finishes
+# after the response's delay on the event loop, like a real child process.
+class FakeProcess(QObject):
+    readyReadStandardOutput = pyqtSignal()
+    finished = pyqtSignal(int, QProcess.ExitStatus)
+    errorOccurred = pyqtSignal(QProcess.ProcessError)
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.stdout = b""
+        self.stderr = b""
+        self.error_string = ""
+        self.response = None
+        self.timer = None
+
+    def start(self, program, arguments):
+        args = [program] + list(arguments)
+        self.factory.calls.append(args)
+        response = self.factory.responses.get(program)
+        if callable(response):
+            response = response(args)
+        if response is None:
+            self.error_string = f"{program}: command not found"
+            QTimer.singleShot(0, lambda: self.errorOccurred.emit(QProcess.FailedToStart))
+            return
+        self.response = response
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.complete)
+        self.timer.start(response.delay_ms)
+
+    def complete(self):
+        self.stdout = self.response.stdout
+        self.stderr = self.response.stderr
+        if self.stdout:
+            self.readyReadStandardOutput.emit()
+        self.finished.emit(self.response.exit_code, QProcess.NormalExit)
+
+    def kill(self):
+        if self.timer and self.timer.isActive():
+            self.timer.stop()
+            self.finished.emit(-1, QProcess.CrashExit)
+
+    terminate = kill
+
+    def waitForFinished(self, msecs=30000):
+        return True
+
+    def readAllStandardOutput(self):
+        data, self.stdout = self.stdout, b""
+        return data
+
+    def readAllStandardError(self):
+        data, self.stderr = self.stderr, b""
+        return data
+
+    def errorString(self):
+        return self.error_string
+
+
+# Process factory for CommandRunner. responses maps a program name to a
+# FakeResponse, or to a callable taking the full argument list and
+# returning one; unknown programs fail to start. Every call is recorded.
+class FakeProcessFactory:
+    def __init__(self, responses=None):
+        self.responses = dict(responses or {})
+        self.calls = []
+
+    def __call__(self, parent=None):
+        return FakeProcess(self, parent)
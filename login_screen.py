@@ -0,0 +1,122 @@
+import json
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal
+
+ADMIN_CREDS_PATH = "/home/pi/wi-pi-demo/icons/admin_creds.json"
+
+# Admin login screen shown when the dashboard logo is double-tapped.
+class LoginScreen(QWidget):
+    # Emitted once the admin credentials have been verified.
+    login_succeeded = pyqtSignal()
+    # Emitted when the user backs out to the dashboard.
+    cancelled = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.setStyleSheet("background-color: #1e1e1e; color: white;")
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Sets up the user interface elements."""
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignCenter)
+        layout.setContentsMargins(60, 20, 60, 40)
+        layout.setSpacing(15)
+
+        header = QLabel("Admin Login")
+        header.setFont(QFont("Arial", 20, QFont.Bold))
+        header.setAlignment(Qt.AlignCenter)
+        layout.addWidget(header)
+
+        self.username_input = QLineEdit()
+        self.username_input.setPlaceholderText("Username")
+        self.username_input.setFont(QFont("Arial", 14))
+        layout.addWidget(self.username_input)
+
+        self.password_input = QLineEdit()
+        self.password_input.setPlaceholderText("Password")
+        self.password_input.setEchoMode(QLineEdit.Password)
+        self.password_input.setFont(QFont("Arial", 14))
+        self.password_input.returnPressed.connect(self.attempt_login)
+        layout.addWidget(self.password_input)
+
+        self.error_label = QLabel("")
+        self.error_label.setFont(QFont("Arial", 12))
+        self.error_label.setStyleSheet("color: #FF5555;")
+        self.error_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.error_label)
+
+        btns = QHBoxLayout()
+        login_btn = QPushButton("Login")
+        login_btn.setFont(QFont("Arial", 14, QFont.Bold))
+        login_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #007BFF;
+                color: #FFFFFF;
+                border: none;
+                border-radius: 20px;
+                padding: 10px;
+            }
+            QPushButton:pressed {
+                background-color: #0056b3;
+            }
+        """)
+        login_btn.clicked.connect(self.attempt_login)
+        back_btn = QPushButton("Back")
+        back_btn.setFont(QFont("Arial", 14, QFont.Bold))
+        back_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #FFFFFF;
+                color: #007BFF;
+                border: 2px solid #007BFF;
+                border-radius: 20px;
+                padding: 8px;
+            }
+            QPushButton:pressed {
+                background-color: #F0F0F0;
+                color: #0056b3;
+            }
+        """)
+        back_btn.clicked.connect(self.cancel)
+        btns.addWidget(login_btn)
+        btns.addWidget(back_btn)
+        layout.addLayout(btns)
+
+        self.setLayout(layout)
+
+    def reset(self):
+        """Clears any previous input so the screen can be shown again."""
+        self.username_input.clear()
+        self.password_input.clear()
+        self.error_label.setText("")
+        self.username_input.setFocus()
+
+    def load_admin_credentials(self):
+        """Loads the admin username and password from a JSON file."""
+        try:
+            with open(ADMIN_CREDS_PATH, "r") as f:
+                data = json.load(f)
+                return data["username"], data["password"]
+        except Exception as e:
+            print(f"Error loading admin credentials: {e}")
+            return None, None
+
+    def attempt_login(self):
+        """Checks the entered credentials and emits the matching signal."""
+        username, password = self.load_admin_credentials()
+        if username is not None and (
+            self.username_input.text().strip() == username
+            and self.password_input.text() == password
+        ):
+            self.reset()
+            self.login_succeeded.emit()
+        else:
+            self.password_input.clear()
+            self.error_label.setText("Invalid username or password.")
+
+    def cancel(self):
+        self.reset()
+        self.cancelled.emit()
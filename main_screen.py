@@ -1,23 +1,50 @@
 import sys
-import json
-import os
-import subprocess # Added the missing subprocess import
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel,
 )
-from PyQt5.QtGui import QFont, QPixmap
-from PyQt5.QtCore import Qt
-import qrcode
-from PIL import Image
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from qr_cache import QRCache
+from qr_frames import QRFrameRing
+from qr_settings import QR_ERROR_CORRECTION, QR_BORDER
+from credential_store import shared_store
+from assets import shared_assets, DASHBOARD_LOGO_SIZE
+import metrics
+
+# qrcode, NumPy and the QR encoder are imported on first render, on a
+# render thread, so starting the kiosk does not pay for them.
+
+# Dashboard QR size in pixels; part of the QR cache key.
+QR_SIZE = 500
+# Time each network stays on screen when there are several
+ROTATE_INTERVAL_MS = 10 * 1000
+# Horizontal drag, in pixels, that counts as a swipe to the next network
+SWIPE_MIN_DISTANCE = 80
 
 # Main screen class to display the QR code and other information
 class MainScreen(QWidget):
+    # Signal to ask the app shell to switch to the login view.
+    login_requested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Wi-Pi | Dashboard")
         self.setGeometry(0, 0, 720, 1250)
         self.setFixedSize(720, 1250)
         self.setStyleSheet("background-color: #1e1e1e; color: white;")
+        self.qr_cache = QRCache()
+        self.frames = QRFrameRing(self.qr_cache, QR_ERROR_CORRECTION, QR_SIZE, QR_BORDER, parent=self)
+        self.frames.frame_ready.connect(self.frame_ready)
+        self.frames.frame_failed.connect(self.frame_failed)
+        # Networks currently rotated through, so unchanged selections skip re-rendering
+        self.shown_networks = None
+        self.current_index = 0
+        self.swipe_start = None
+        self.rotate_timer = QTimer(self)
+        self.rotate_timer.setInterval(ROTATE_INTERVAL_MS)
+        self.rotate_timer.timeout.connect(self.show_next)
+        self.credential_store = shared_store()
+        self.credential_store.networks_changed.connect(self.show_networks)
 
         self.setup_ui()
 
@@ -35,35 +62,32 @@ class MainScreen(QWidget):
         # Spacer
         layout.addSpacing(50)
 
-        # Generate and display QR Code
-        wifi_name, wifi_password = self.load_selected_network()
-        qr_img = self.generate_qr_image(wifi_name, wifi_password)
-        
-        qr_label = QLabel()
-        # Convert PIL Image to QPixmap
-        qr_pixmap = QPixmap.fromImage(qr_img.toqimage())
-        # Scale QR code to a larger size, for example 500x500
-        scaled_qr = qr_pixmap.scaled(500, 500, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        qr_label.setPixmap(scaled_qr)
-        qr_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(qr_label)
+        # QR Code, filled in by refresh()
+        self.qr_label = QLabel()
+        self.qr_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.qr_label)
 
         # Spacer
         layout.addSpacing(50)
         
         # Display the SSID as text
-        ssid_label = QLabel(f"Network: {wifi_name}")
-        ssid_label.setFont(QFont("Arial", 16))
-        ssid_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(ssid_label)
+        self.ssid_label = QLabel()
+        self.ssid_label.setFont(QFont("Arial", 16))
+        self.ssid_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.ssid_label)
+
+        # Position in the rotation, only shown with several networks
+        self.page_label = QLabel()
+        self.page_label.setFont(QFont("Arial", 12))
+        self.page_label.setAlignment(Qt.AlignCenter)
+        self.page_label.hide()
+        layout.addWidget(self.page_label)
 
         # Wi-Pi Logo at the bottom that can be double-tapped
         self.logo_label = QLabel()
-        logo_path = "/home/pi/wi-pi-demo/icons/wi-pi-logo.png"
-        if os.path.exists(logo_path):
-            pm = QPixmap(logo_path).scaled(150, 75, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            if not pm.isNull():
-                self.logo_label.setPixmap(pm)
+        pm = shared_assets().pixmap("wi-pi-logo.png", DASHBOARD_LOGO_SIZE)
+        if not pm.isNull():
+            self.logo_label.setPixmap(pm)
         else:
             self.logo_label.setText("Wi-Pi")
             self.logo_label.setFont(QFont("Arial", 24, QFont.Bold))
@@ -76,37 +100,116 @@ class MainScreen(QWidget):
 
         self.setLayout(layout)
 
-    def load_selected_network(self):
-        """Loads Wi-Fi network information from a JSON file."""
-        try:
-            with open("/home/pi/wi-pi-demo/selected_network.json", "r") as f:
-                data = json.load(f)
-                return data["wifi_name"], data["wifi_password"]
-        except Exception as e:
-            print(f"Error loading selected network: {e}")
-            return "WiPi_Network", "securepass123"
-
-    def generate_qr_image(self, ssid, password):
-        """Generates a QR code image from the Wi-Fi data."""
-        qr_data = f"WIFI:T:WPA;S:{ssid};P:{password};;"
-        qr = qrcode.QRCode(box_size=10, border=2)
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        return qr.make_image(fill="black", back_color="white")
+    def refresh(self):
+        """
+        Re-reads the selected networks and updates the rotation if they
+        changed. Called by the app shell each time the dashboard is shown.
+        """
+        networks = self.credential_store.load_networks()
+        if networks != self.shown_networks:
+            self.show_networks(networks)
+
+    def show_networks(self, networks):
+        """Starts rotating through networks, pre-rendering their QR frames."""
+        self.shown_networks = list(networks)
+        self.frames.set_networks(self.shown_networks)
+        self.page_label.setVisible(len(self.shown_networks) > 1)
+        self.show_index(0)
+        self.update_rotation()
+
+    def show_index(self, index):
+        """
+        Moves the dashboard to a network. A prepared frame is swapped in at
+        once; otherwise a placeholder stays up until frame_ready delivers it.
+        """
+        self.current_index = index
+        self.frames.prefetch(index)
+        if not self.shown_networks:
+            self.qr_label.clear()
+            self.ssid_label.clear()
+            return
+        wifi_name = self.shown_networks[index][0]
+        self.ssid_label.setText(f"Network: {wifi_name}")
+        self.page_label.setText(f"{index + 1} / {len(self.shown_networks)}")
+        pixmap = self.frames.frame(index)
+        if pixmap is not None:
+            self.display(pixmap)
+        else:
+            self.qr_label.setText("Loading QR code...")
+
+    def frame_ready(self, index):
+        if index == self.current_index:
+            self.display(self.frames.frame(index))
+
+    def frame_failed(self, index):
+        if index == self.current_index:
+            self.qr_label.setText("QR code unavailable")
+
+    def display(self, pixmap):
+        self.qr_label.setPixmap(pixmap)
+        metrics.count("dashboard.frames_shown")
+
+    def show_next(self):
+        if self.shown_networks:
+            self.show_index((self.current_index + 1) % len(self.shown_networks))
+
+    def show_previous(self):
+        if self.shown_networks:
+            self.show_index((self.current_index - 1) % len(self.shown_networks))
+
+    def update_rotation(self):
+        """Runs the rotation timer only while several networks are on screen."""
+        if self.isVisible() and self.shown_networks and len(self.shown_networks) > 1:
+            self.rotate_timer.start()
+        else:
+            self.rotate_timer.stop()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_rotation()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_rotation()
+
+    def mousePressEvent(self, event):
+        self.swipe_start = event.pos()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Swiping left shows the next network, swiping right the previous one."""
+        if self.swipe_start is not None:
+            distance = event.pos().x() - self.swipe_start.x()
+            self.swipe_start = None
+            if abs(distance) >= SWIPE_MIN_DISTANCE and self.shown_networks and len(self.shown_networks) > 1:
+                if distance < 0:
+                    self.show_next()
+                else:
+                    self.show_previous()
+                # Give the chosen network a full interval on screen
+                self.update_rotation()
+        super().mouseReleaseEvent(event)
 
     def go_to_login(self, event):
         """
         Handles double-click event on the logo to go to a login page.
         """
         print("Double-tapped on Wi-Pi logo. Navigating to login page...")
-        try:
-            subprocess.Popen(["python3", "/home/pi/wi-pi-demo/login_screen.py"])
-            self.close()
-        except FileNotFoundError:
-            print("Error: login_screen.py not found. Please ensure the path is correct.")
+        self.login_requested.emit()
+
+def create_window():
+    """
+    Builds the kiosk shell with the dashboard in front, so the login view
+    is reachable without starting another process.
+    """
+    from wifi_selector_gui import WifiManager
+
+    window = WifiManager()
+    window.show_dashboard()
+    return window
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = MainScreen()
+    window = create_window()
     window.show()
     sys.exit(app.exec_())
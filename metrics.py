@@ -0,0 +1,277 @@
+import os
+import json
+import stat
+import time
+import atexit
+import logging
+import threading
+from logging.handlers import RotatingFileHandler
+
+# Lightweight timing spans and counters for the kiosk's hot paths.
+#
+# Off unless WIPI_METRICS is set (to 1, or to the file to write). While off,
+# span() hands back one shared no-op object and count() returns straight
+# away, so instrumented code pays for a function call and nothing else.
+# While on, every finished span is appended as a JSON line to a rotating
+# file, and running totals can be read from an optional local endpoint:
+#
+#     WIPI_METRICS=1 WIPI_METRICS_PORT=8765 python3 wifi_selector_gui.py
+#     curl http://127.0.0.1:8765/
+#
+#     WIPI_METRICS=1 WIPI_METRICS_SOCKET=/tmp/wipi-metrics.sock python3 main_screen.py
+#     socat - UNIX-CONNECT:/tmp/wipi-metrics.sock
+
+METRICS_PATH = "/home/pi/wi-pi-demo/logs/metrics.jsonl"
+MAX_FILE_BYTES = 1024 * 1024
+BACKUP_COUNT = 3
+
+
+# A running span. Use it as a context manager, or call stop() when the work
+# finishes in a later callback.
+class Span:
+    __slots__ = ("recorder", "name", "fields", "started")
+
+    def __init__(self, recorder, name, fields):
+        self.recorder = recorder
+        self.name = name
+        self.fields = fields
+        self.started = time.perf_counter()
+
+    def stop(self, **fields):
+        """Ends the span, adding any extra fields to its record."""
+        if self.recorder is None:
+            return
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        self.fields.update(fields)
+        self.recorder.record(self.name, elapsed_ms, self.fields)
+        # A span is recorded once, however many times it is stopped
+        self.recorder = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.fields["error"] = exc_type.__name__
+        self.stop()
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def stop(self, **fields):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# Aggregates spans and counters and writes spans to the JSON-lines log.
+# Spans come from the GUI thread, snapshots from the endpoint thread.
+class Recorder:
+    def __init__(self, path=METRICS_PATH, max_bytes=MAX_FILE_BYTES, backup_count=BACKUP_COUNT):
+        self.lock = threading.Lock()
+        self.spans = {}
+        self.counters = {}
+        self.started = time.time()
+        self.logger = None
+        if path:
+            self.logger = self.open_log(path, max_bytes, backup_count)
+
+    def open_log(self, path, max_bytes, backup_count):
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count)
+        except OSError as e:
+            print(f"Metrics log disabled: {e}")
+            return None
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger(f"wipi.metrics.{id(self)}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        return logger
+
+    def record(self, name, elapsed_ms, fields):
+        with self.lock:
+            totals = self.spans.get(name)
+            if totals is None:
+                totals = self.spans[name] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            totals["count"] += 1
+            totals["total_ms"] += elapsed_ms
+            totals["max_ms"] = max(totals["max_ms"], elapsed_ms)
+        self.write({"ts": round(time.time(), 3), "span": name, "ms": round(elapsed_ms, 3), **fields})
+
+    def count(self, name, amount):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def write(self, entry):
+        if self.logger is not None:
+            self.logger.info(json.dumps(entry, default=str))
+
+    def snapshot(self):
+        """Returns the running totals: per-span count, total, mean and max, and every counter."""
+        with self.lock:
+            spans = {
+                name: {
+                    "count": totals["count"],
+                    "total_ms": round(totals["total_ms"], 3),
+                    "mean_ms": round(totals["total_ms"] / totals["count"], 3),
+                    "max_ms": round(totals["max_ms"], 3),
+                }
+                for name, totals in self.spans.items()
+            }
+            counters = dict(self.counters)
+        return {
+            "ts": round(time.time(), 3),
+            "uptime_s": round(time.time() - self.started, 3),
+            "spans": spans,
+            "counters": counters,
+        }
+
+    def dump(self):
+        """Appends the current totals to the log as a snapshot line."""
+        self.write({"snapshot": self.snapshot()})
+
+    def close(self):
+        if self.logger is not None:
+            for handler in list(self.logger.handlers):
+                handler.close()
+                self.logger.removeHandler(handler)
+            self.logger = None
+
+
+_recorder = None
+_servers = []
+
+
+def enabled():
+    return _recorder is not None
+
+
+def span(name, **fields):
+    """Starts a timing span; a shared no-op when metrics are off."""
+    if _recorder is None:
+        return _NULL_SPAN
+    return Span(_recorder, name, fields)
+
+
+def count(name, amount=1):
+    """Adds to a named counter; does nothing when metrics are off."""
+    if _recorder is not None:
+        _recorder.count(name, amount)
+
+
+def snapshot():
+    """Returns the running totals, or None when metrics are off."""
+    return _recorder.snapshot() if _recorder is not None else None
+
+
+def dump():
+    if _recorder is not None:
+        _recorder.dump()
+
+
+def serve_http(port, host="127.0.0.1"):
+    """Serves the current snapshot as JSON over HTTP from a daemon thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(snapshot()).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return _start_server(ThreadingHTTPServer((host, port), Handler))
+
+
+def serve_unix(path):
+    """Writes the current snapshot as one JSON line to each client of a Unix socket."""
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            self.wfile.write(json.dumps(snapshot()).encode("utf-8") + b"\n")
+
+    # Only a socket left behind by an earlier run is replaced
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            raise OSError(f"{path} exists and is not a socket")
+        os.unlink(path)
+    return _start_server(socketserver.ThreadingUnixStreamServer(path, Handler))
+
+
+def _start_server(server):
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-endpoint", daemon=True)
+    thread.start()
+    _servers.append(server)
+    return server
+
+
+def configure(path=METRICS_PATH, http_port=None, socket_path=None):
+    """
+    Turns metrics on, logging spans to path (None for no file) and
+    optionally serving snapshots over HTTP on localhost or a Unix socket.
+    """
+    global _recorder
+    shutdown()
+    _recorder = Recorder(path)
+    try:
+        if http_port:
+            serve_http(http_port)
+        if socket_path:
+            serve_unix(socket_path)
+    except OSError as e:
+        print(f"Metrics endpoint disabled: {e}")
+    return _recorder
+
+
+def shutdown():
+    """Writes a final snapshot, stops the endpoints and turns metrics off."""
+    global _recorder
+    for server in _servers:
+        server.shutdown()
+        server.server_close()
+        address = server.server_address
+        if isinstance(address, str) and os.path.exists(address):
+            os.unlink(address)
+    _servers.clear()
+    if _recorder is not None:
+        _recorder.dump()
+        _recorder.close()
+        _recorder = None
+
+
+def configure_from_env(environ=os.environ):
+    setting = environ.get("WIPI_METRICS", "")
+    if setting in ("", "0"):
+        return
+    port = environ.get("WIPI_METRICS_PORT")
+    configure(
+        path=METRICS_PATH if setting == "1" else setting,
+        http_port=int(port) if port else None,
+        socket_path=environ.get("WIPI_METRICS_SOCKET"),
+    )
+
+
+configure_from_env()
+atexit.register(shutdown)
@@ -0,0 +1,87 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from assets import shared_assets
+
+# Custom data role for whether a network needs a password.
+SecuredRole = Qt.UserRole + 1
+
+
+# List model of scanned networks. New scan results are applied as a diff so
+# the view keeps its selection and scroll position and only the rows that
+# actually changed are repainted.
+class NetworkListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Each row is a wifi_scan.Network
+        self.networks = []
+        self.lock_icon = shared_assets().icon("lock.png")
+        self.unlock_icon = shared_assets().icon("unlock.png")
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.networks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.networks):
+            return None
+        network = self.networks[index.row()]
+        if role == Qt.DisplayRole:
+            return network.ssid
+        if role == Qt.DecorationRole:
+            return self.lock_icon if network.secured else self.unlock_icon
+        if role == Qt.ToolTipRole:
+            return f"Signal {network.signal}% - channel {network.channel}"
+        if role == SecuredRole:
+            return network.secured
+        return None
+
+    def apply_networks(self, networks):
+        """
+        Updates the model to match the given list of Networks with the
+        fewest model signals: one remove per contiguous block of vanished
+        rows, one dataChanged per changed row, a single insert for new rows
+        and one layout change if the order differs.
+        """
+        wanted = {network.ssid: network for network in networks}
+
+        # Remove vanished rows bottom-up, one contiguous block at a time
+        row = len(self.networks) - 1
+        while row >= 0:
+            if self.networks[row].ssid in wanted:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self.networks[row].ssid not in wanted:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self.networks[row + 1:last + 1]
+            self.endRemoveRows()
+
+        # Update rows whose details changed in place
+        for row, network in enumerate(self.networks):
+            if wanted[network.ssid] != network:
+                self.networks[row] = wanted[network.ssid]
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+        # Append new rows in one batch
+        present = {network.ssid for network in self.networks}
+        added = [network for network in networks if network.ssid not in present]
+        if added:
+            first = len(self.networks)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self.networks.extend(added)
+            self.endInsertRows()
+
+        # Reorder to the scan order, keeping selections attached to their SSIDs
+        ordered = list(networks)
+        if self.networks != ordered:
+            self.layoutAboutToBeChanged.emit()
+            new_rows = {network.ssid: row for row, network in enumerate(ordered)}
+            old_indexes = self.persistentIndexList()
+            new_indexes = [
+                self.index(new_rows[self.networks[index.row()].ssid]) for index in old_indexes
+            ]
+            self.networks = ordered
+            self.changePersistentIndexList(old_indexes, new_indexes)
+            self.layoutChanged.emit()
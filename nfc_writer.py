@@ -1,25 +1,171 @@
 import nfc
+import ndef
+import sys
 import time
 import json
+import argparse
+from wsc_record import wsc_record
 
-def write_nfc_tag():
+CREDENTIALS_PATH = "selected_network.json"
+READER_PATH = '/dev/ttyS0'  # UART port
+# Print a progress line after this many tags in batch mode
+REPORT_EVERY = 10
+# Record choices for --record
+RECORD_FORMATS = ("smallest", "wsc", "text")
+
+
+def load_credentials(path=CREDENTIALS_PATH):
+    """Loads (ssid, password) from the selected network file, or None."""
     try:
-        with open("selected_network.json", "r") as f:
+        with open(path, "r") as f:
             data = json.load(f)
-            ssid = data.get("wifi_name", "")
-            password = data.get("wifi_password", "")
+            return data.get("wifi_name", ""), data.get("wifi_password", "")
     except Exception as e:
         print(f"Failed to load Wi-Fi credentials: {e}")
-        return
+        return None
 
+
+def encode_message(ssid, password):
+    """Encodes the Wi-Fi credentials as a QR-style text record message."""
     wifi_payload = f"WIFI:T:WPA;S:{ssid};P:{password};;"
+    return b"".join(ndef.message_encoder([ndef.TextRecord(wifi_payload)]))
+
+
+def encode_wsc_message(ssid, password):
+    """Encodes the Wi-Fi credentials as a Wi-Fi Simple Config message, or None if invalid."""
+    try:
+        return b"".join(ndef.message_encoder([wsc_record(ssid, password)]))
+    except ValueError as e:
+        print(f"Cannot encode Wi-Fi Simple Config record: {e}")
+        return None
+
+
+def encode_messages(ssid, password, record_format="smallest"):
+    """
+    Returns the candidate message octets in order of preference: just the
+    requested record for "wsc" or "text", or both shortest first for
+    "smallest", so each tag gets the fewest page writes that fit.
+    """
+    wsc = encode_wsc_message(ssid, password) if record_format != "text" else None
+    text = encode_message(ssid, password) if record_format != "wsc" else None
+    return sorted((octets for octets in (wsc, text) if octets is not None), key=len)
+
+
+def choose_message(messages, capacity):
+    """Returns the first message that fits the tag's NDEF capacity, or None."""
+    for octets in messages:
+        if len(octets) <= capacity:
+            return octets
+    return None
+
+
+# Writes pre-encoded NDEF messages to every tag presented to the reader,
+# using the first candidate that fits each tag. Tags that already hold it
+# are skipped, and each write is read back to verify it before the tag
+# counts as written.
+class BatchWriter:
+    def __init__(self, messages, verify=True, max_tags=None):
+        self.messages = messages
+        self.verify = verify
+        self.max_tags = max_tags
+        self.written = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started = None
+
+    @property
+    def processed(self):
+        return self.written + self.skipped + self.failed
+
+    def tags_per_minute(self):
+        elapsed = time.monotonic() - self.started if self.started else 0
+        return self.processed / elapsed * 60 if elapsed else 0.0
+
+    def report(self):
+        print(
+            f" {self.written} written, {self.skipped} already provisioned, "
+            f"{self.failed} failed ({self.tags_per_minute():.1f} tags/min)"
+        )
+
+    def provision(self, tag):
+        """Writes the message to one tag. Returns 'written', 'skipped' or 'failed'."""
+        if tag.ndef is None:
+            print(" Tag is not NDEF formatted.")
+            return "failed"
+        octets = choose_message(self.messages, tag.ndef.capacity)
+        if octets is None:
+            print(f" Tag is too small ({tag.ndef.capacity} bytes).")
+            return "failed"
+        if tag.ndef.octets == octets:
+            return "skipped"
+        if not tag.ndef.is_writeable:
+            print(" Tag is read-only.")
+            return "failed"
+        try:
+            tag.ndef.octets = octets
+            # has_changed re-reads the tag and compares it with what was written
+            if self.verify and (tag.ndef.has_changed or tag.ndef is None):
+                print(" Read-back did not match the written message.")
+                return "failed"
+        except Exception as e:
+            print(f" Failed to write NFC Tag: {e}")
+            return "failed"
+        return "written"
 
-    clf = nfc.ContactlessFrontend('/dev/ttyS0')  # UART port
+    def on_connect(self, tag):
+        outcome = self.provision(tag)
+        if outcome == "written":
+            self.written += 1
+        elif outcome == "skipped":
+            self.skipped += 1
+        else:
+            self.failed += 1
+        if self.processed % REPORT_EVERY == 0:
+            self.report()
+        # Wait for the tag to be removed before looking for the next one
+        return True
+
+    def done(self):
+        return self.max_tags is not None and self.processed >= self.max_tags
+
+    def run(self, clf):
+        """Keeps the reader open and provisions tags until stopped."""
+        self.started = time.monotonic()
+        try:
+            while not self.done():
+                if not clf.connect(rdwr={'on-connect': self.on_connect}, terminate=self.done):
+                    break
+        except KeyboardInterrupt:
+            pass
+        self.report()
+
+
+def load_messages(record_format):
+    """Loads the selected network and encodes it, or returns None after explaining why not."""
+    credentials = load_credentials()
+    if credentials is None:
+        return None
+    messages = encode_messages(*credentials, record_format)
+    if not messages:
+        print(f"No {record_format} record can be written for these credentials.")
+        return None
+    return messages
+
+
+def write_nfc_tag(record_format="smallest"):
+    messages = load_messages(record_format)
+    if messages is None:
+        return
+
+    clf = nfc.ContactlessFrontend(READER_PATH)
     print("Touch NFC tag to write Wi-Fi credentials...")
 
     def connected(tag):
         try:
-            tag.ndef.message = nfc.ndef.Message(nfc.ndef.TextRecord(wifi_payload))
+            octets = choose_message(messages, tag.ndef.capacity)
+            if octets is None:
+                raise ValueError(f"no record fits the tag's {tag.ndef.capacity} bytes")
+            tag.ndef.octets = octets
             print(" NFC Tag written successfully!")
         except Exception as e:
             print(f" Failed to write NFC Tag: {e}")
@@ -27,3 +173,39 @@ def write_nfc_tag():
 
     clf.connect(rdwr={'on-connect': connected})
     clf.close()
+
+
+def write_nfc_tags(record_format="smallest", verify=True, max_tags=None):
+    """Batch mode: opens the reader once and provisions tags until Ctrl+C."""
+    messages = load_messages(record_format)
+    if messages is None:
+        return
+    writer = BatchWriter(messages, verify=verify, max_tags=max_tags)
+
+    clf = nfc.ContactlessFrontend(READER_PATH)
+    print("Touch NFC tags one after another to write Wi-Fi credentials (Ctrl+C to stop)...")
+    try:
+        writer.run(clf)
+    finally:
+        clf.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the selected Wi-Fi network to NFC tags.")
+    parser.add_argument("--batch", action="store_true", help="keep the reader open and write many tags")
+    parser.add_argument("--count", type=int, help="stop after this many tags in batch mode")
+    parser.add_argument("--no-verify", action="store_true", help="skip reading each tag back")
+    parser.add_argument(
+        "--record", choices=RECORD_FORMATS, default="smallest",
+        help="NDEF record to write: the smallest that fits, a Wi-Fi Simple Config handover or QR-style text",
+    )
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        write_nfc_tags(args.record, verify=not args.no_verify, max_tags=args.count)
+    else:
+        write_nfc_tag(args.record)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
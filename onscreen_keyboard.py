@@ -0,0 +1,134 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QSizePolicy
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt
+
+# Character rows for each layer. Every layer has the same shape, so
+# switching layers only relabels the existing buttons.
+LETTER_ROWS = [
+    "1234567890",
+    "qwertyuiop",
+    "asdfghjkl@",
+    "zxcvbnm-_.",
+]
+SYMBOL_ROWS = [
+    "1234567890",
+    "!@#$%^&*()",
+    "~`+=[]{}\\|",
+    ";:'\"<>/?,-",
+]
+
+KEY_STYLE = """
+    QPushButton {
+        background-color: #3d3d3d;
+        color: #FFFFFF;
+        border: none;
+        border-radius: 6px;
+        padding: 6px;
+    }
+    QPushButton:pressed {
+        background-color: #007BFF;
+    }
+    QPushButton:checked {
+        background-color: #0056b3;
+    }
+"""
+
+
+# In-process on-screen keyboard. It types into a QLineEdit directly, so
+# there is no external keyboard process to start or stop, and it is built
+# once and reused for every password prompt.
+class OnScreenKeyboard(QWidget):
+    def __init__(self, target=None, parent=None):
+        super().__init__(parent)
+        self.target = target
+        self.shifted = False
+        self.symbols = False
+        self.char_buttons = []
+        self.setStyleSheet(KEY_STYLE)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Builds the key grid once; layers reuse the same buttons."""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        for row in LETTER_ROWS:
+            row_layout = QHBoxLayout()
+            row_layout.setSpacing(4)
+            for char in row:
+                button = self.make_key(char)
+                button.clicked.connect(lambda _, b=button: self.type_text(b.text()))
+                self.char_buttons.append(button)
+                row_layout.addWidget(button)
+            layout.addLayout(row_layout)
+
+        bottom = QHBoxLayout()
+        bottom.setSpacing(4)
+        self.shift_button = self.make_key("Shift")
+        self.shift_button.setCheckable(True)
+        self.shift_button.clicked.connect(self.toggle_shift)
+        bottom.addWidget(self.shift_button, 2)
+        self.symbols_button = self.make_key("?123")
+        self.symbols_button.setCheckable(True)
+        self.symbols_button.clicked.connect(self.toggle_symbols)
+        bottom.addWidget(self.symbols_button, 2)
+        space_button = self.make_key("Space")
+        space_button.clicked.connect(lambda: self.type_text(" "))
+        bottom.addWidget(space_button, 4)
+        backspace_button = self.make_key("⌫")
+        backspace_button.setAutoRepeat(True)
+        backspace_button.clicked.connect(self.backspace)
+        bottom.addWidget(backspace_button, 2)
+        layout.addLayout(bottom)
+
+        self.setLayout(layout)
+
+    def make_key(self, label):
+        button = QPushButton(label)
+        button.setFont(QFont("Arial", 14))
+        # Keep keyboard focus in the line edit being typed into
+        button.setFocusPolicy(Qt.NoFocus)
+        button.setMinimumHeight(48)
+        button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        return button
+
+    def relabel(self):
+        rows = SYMBOL_ROWS if self.symbols else LETTER_ROWS
+        chars = "".join(rows)
+        if self.shifted and not self.symbols:
+            chars = chars.upper()
+        for button, char in zip(self.char_buttons, chars):
+            button.setText("&&" if char == "&" else char)
+
+    def toggle_shift(self):
+        self.shifted = not self.shifted
+        self.shift_button.setChecked(self.shifted)
+        self.relabel()
+
+    def toggle_symbols(self):
+        self.symbols = not self.symbols
+        self.symbols_button.setChecked(self.symbols)
+        self.relabel()
+
+    def reset(self):
+        """Returns to the lower-case letter layer."""
+        if self.shifted or self.symbols:
+            self.shifted = False
+            self.symbols = False
+            self.shift_button.setChecked(False)
+            self.symbols_button.setChecked(False)
+            self.relabel()
+
+    def type_text(self, text):
+        if self.target is None:
+            return
+        # "&&" is how a literal ampersand is shown on a button
+        self.target.insert(text.replace("&&", "&"))
+        # Shift applies to a single character, like a phone keyboard
+        if self.shifted:
+            self.toggle_shift()
+
+    def backspace(self):
+        if self.target is not None:
+            self.target.backspace()
@@ -0,0 +1,112 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from PyQt5.QtGui import QImage
+import metrics
+
+# Rendered QR codes are kept here; WIPI_QR_CACHE_DIR overrides it
+QR_CACHE_DIR = "/home/pi/wi-pi-demo/cache/qr"
+
+# Two-level cache for rendered QR pixmaps: a small in-memory LRU in front of
+# a PNG store on disk, so a known network is drawn from a ready-made image
+# on boot instead of being re-encoded and rescaled.
+class QRCache:
+    def __init__(self, cache_dir=None, max_memory_entries=8, max_disk_entries=64):
+        self.cache_dir = cache_dir or os.environ.get("WIPI_QR_CACHE_DIR") or QR_CACHE_DIR
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def make_key(self, ssid, password, error_correction, size):
+        """Builds a stable cache key that does not leak the credentials into file names."""
+        raw = "\0".join([ssid, password, str(error_correction), str(size)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def get_memory(self, key):
+        """Returns the pixmap for a key if it is in memory. GUI thread only."""
+        pixmap = self.memory.get(key)
+        if pixmap is not None:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            metrics.count("qr_cache.memory_hits")
+        return pixmap
+
+    def load_image(self, key):
+        """
+        Reads a cached PNG as a QImage, or returns None. Touches only the
+        disk store, so render threads can call it.
+        """
+        path = self.disk_path(key)
+        if not os.path.exists(path):
+            return None
+        with metrics.span("qr_cache.disk_load"):
+            image = QImage(path)
+        if image.isNull():
+            return None
+        # Refresh the mtime so disk eviction stays least-recently-used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+
+    def count_disk_hit(self):
+        self.hits += 1
+        self.disk_hits += 1
+        metrics.count("qr_cache.disk_hits")
+
+    def count_miss(self):
+        self.misses += 1
+        metrics.count("qr_cache.misses")
+
+    def report(self):
+        print(f"QR cache: {self.hits} hits ({self.disk_hits} from disk), {self.misses} misses")
+
+    def remember(self, key, pixmap):
+        self.memory[key] = pixmap
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def write_to_disk(self, key, image):
+        """
+        Writes a rendered QImage atomically and evicts the oldest files over
+        the limit. Render threads call it.
+        """
+        path = self.disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if not image.save(tmp_path, "PNG"):
+                raise OSError(f"could not write {tmp_path}")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing QR cache: {e}")
+            return
+        self.evict()
+
+    def evict(self):
+        """Removes least-recently-used PNGs once the disk store is over its limit."""
+        try:
+            entries = [
+                os.path.join(self.cache_dir, name)
+                for name in os.listdir(self.cache_dir)
+                if name.endswith(".png")
+            ]
+            if len(entries) <= self.max_disk_entries:
+                return
+            entries.sort(key=os.path.getmtime)
+            for path in entries[:len(entries) - self.max_disk_entries]:
+                os.remove(path)
+        except FileNotFoundError:
+            # Another render thread evicted the same file first
+            pass
+        except OSError as e:
+            print(f"Error evicting QR cache: {e}")
@@ -0,0 +1,233 @@
+from bisect import bisect_left
+import numpy as np
+from qrcode import QRCode, constants, exceptions, util
+
+# Fast encoder for the dashboard's Wi-Fi payload. The data codewords come
+# from the qrcode package as before; version fitting is a direct lookup in
+# its capacity table and all eight masks are placed and scored at once with
+# NumPy, so the resulting matrix is identical to QRCode.make(fit=True).
+
+# Same chunking threshold as QRCode.add_data's default
+OPTIMIZE_MINIMUM = 20
+# First and last version of each character-count-indicator size group
+VERSION_GROUPS = ((1, 9), (10, 26), (27, 40))
+
+FINDER_LIKE_PATTERNS = np.array([
+    [1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0],
+    [0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1],
+], dtype=bool)
+
+# Per-version blank matrix and data placement order
+_templates = {}
+
+
+def wifi_qr_payload(ssid, password):
+    """Builds the QR-style Wi-Fi string shown on the dashboard."""
+    return f"WIFI:T:WPA;S:{ssid};P:{password};;"
+
+
+def data_bit_length(chunk, group):
+    """Returns the number of bits a chunk needs for versions in the given group."""
+    length = len(chunk)
+    size = util.mode_sizes_for_version(VERSION_GROUPS[group][0])[chunk.mode]
+    if chunk.mode == util.MODE_NUMBER:
+        bits = 10 * (length // 3) + (0, 4, 7)[length % 3]
+    elif chunk.mode == util.MODE_ALPHA_NUM:
+        bits = 11 * (length // 2) + 6 * (length % 2)
+    else:
+        bits = 8 * length
+    return 4 + size + bits
+
+
+def fit_version(chunks, error_correction):
+    """Finds the smallest version whose data capacity holds the chunks."""
+    limits = util.BIT_LIMIT_TABLE[error_correction]
+    for group, (first, last) in enumerate(VERSION_GROUPS):
+        needed = sum(data_bit_length(chunk, group) for chunk in chunks)
+        version = bisect_left(limits, needed, first)
+        if version <= last:
+            return version
+    raise exceptions.DataOverflowError()
+
+
+def format_positions(count):
+    """Returns the (rows, cols) of the 15 format bits, vertical copy then horizontal."""
+    rows, cols = [], []
+    for i in range(15):
+        if i < 6:
+            rows.append(i)
+        elif i < 8:
+            rows.append(i + 1)
+        else:
+            rows.append(count - 15 + i)
+        cols.append(8)
+    for i in range(15):
+        rows.append(8)
+        if i < 8:
+            cols.append(count - i - 1)
+        elif i < 9:
+            cols.append(15 - i)
+        else:
+            cols.append(15 - i - 1)
+    return np.array(rows), np.array(cols)
+
+
+def version_positions(count):
+    """Returns the (rows, cols) of the 18 version bits, both copies."""
+    i = np.arange(18)
+    rows = np.concatenate([i // 3, i % 3 + count - 11])
+    cols = np.concatenate([i % 3 + count - 11, i // 3])
+    return rows, cols
+
+
+class _BlankQR(QRCode):
+    """QRCode with just enough state to reuse its function-pattern setup."""
+
+    def __init__(self, version, count):
+        self._version = version
+        # Only read for format bits, which are left light in test mode
+        self.error_correction = constants.ERROR_CORRECT_M
+        self.modules_count = count
+        self.modules = [[None] * count for _ in range(count)]
+
+
+def build_template(version):
+    """
+    Builds the function patterns for a version the same way QRCode.makeImpl
+    does in test mode, plus the order in which data bits are placed.
+    """
+    count = version * 4 + 17
+    qr = _BlankQR(version, count)
+    qr.setup_position_probe_pattern(0, 0)
+    qr.setup_position_probe_pattern(count - 7, 0)
+    qr.setup_position_probe_pattern(0, count - 7)
+    qr.setup_position_adjust_pattern()
+    qr.setup_timing_pattern()
+    qr.setup_type_info(True, 0)
+    if version >= 7:
+        qr.setup_type_number(True)
+
+    modules = qr.modules
+    blank = np.array([[bool(m) for m in row] for row in modules], dtype=bool)
+
+    # Same zig-zag walk as QRCode.map_data, recording free cells only
+    order_rows, order_cols = [], []
+    inc = -1
+    row = count - 1
+    for col in range(count - 1, 0, -2):
+        if col <= 6:
+            col -= 1
+        while True:
+            for c in (col, col - 1):
+                if modules[row][c] is None:
+                    order_rows.append(row)
+                    order_cols.append(c)
+            row += inc
+            if row < 0 or count <= row:
+                row -= inc
+                inc = -inc
+                break
+
+    order = (np.array(order_rows), np.array(order_cols))
+    i, j = order
+    masks = np.array([
+        (i + j) % 2 == 0,
+        i % 2 == 0,
+        j % 3 == 0,
+        (i + j) % 3 == 0,
+        (i // 2 + j // 3) % 2 == 0,
+        (i * j) % 2 + (i * j) % 3 == 0,
+        ((i * j) % 2 + (i * j) % 3) % 2 == 0,
+        ((i * j) % 3 + (i + j) % 2) % 2 == 0,
+    ])
+    return blank, order, masks
+
+
+def get_template(version):
+    template = _templates.get(version)
+    if template is None:
+        template = _templates[version] = build_template(version)
+    return template
+
+
+def run_penalty(lines):
+    """Rule 1: runs of five or more same-colour modules, per stacked matrix."""
+    stacks, rows, width = lines.shape
+    # A sentinel column stops runs from joining across rows
+    padded = np.full((stacks, rows, width + 1), 2, dtype=np.int8)
+    padded[:, :, :width] = lines
+    flat = padded.ravel()
+    starts = np.flatnonzero(np.concatenate(([True], flat[1:] != flat[:-1])))
+    lengths = np.diff(np.append(starts, flat.size))
+    keep = (flat[starts] != 2) & (lengths >= 5)
+    stack_ids = starts[keep] // (rows * (width + 1))
+    return np.bincount(stack_ids, weights=lengths[keep] - 2, minlength=stacks).astype(np.int64)
+
+
+def pattern_penalty(lines):
+    """Rule 3: 1:1:3:1:1 finder-like patterns with a light margin, per stacked matrix."""
+    windows = np.lib.stride_tricks.sliding_window_view(lines, 11, axis=2)
+    hits = np.zeros(windows.shape[:3], dtype=bool)
+    for pattern in FINDER_LIKE_PATTERNS:
+        hits |= (windows == pattern).all(axis=3)
+    return hits.sum(axis=(1, 2)) * 40
+
+
+def lost_points(candidates):
+    """Scores a (8, n, n) stack of masked matrices like qrcode.util.lost_point."""
+    count = candidates.shape[1]
+    columns = candidates.transpose(0, 2, 1)
+
+    level1 = run_penalty(candidates) + run_penalty(columns)
+
+    top_left = candidates[:, :-1, :-1]
+    blocks = (
+        (top_left == candidates[:, 1:, :-1])
+        & (top_left == candidates[:, :-1, 1:])
+        & (top_left == candidates[:, 1:, 1:])
+    )
+    level2 = blocks.sum(axis=(1, 2)) * 3
+
+    level3 = pattern_penalty(candidates) + pattern_penalty(columns)
+
+    # Keep the float arithmetic of the reference implementation
+    level4 = [
+        int(abs(float(dark) / (count ** 2) * 100 - 50) / 5) * 10
+        for dark in candidates.sum(axis=(1, 2)).tolist()
+    ]
+    return level1 + level2 + level3 + np.array(level4)
+
+
+def encode(data, error_correction=constants.ERROR_CORRECT_M):
+    """
+    Encodes data into a QR module matrix (bool array, no quiet zone) that
+    matches QRCode(error_correction=...).add_data(data); make(fit=True).
+    """
+    chunks = list(util.optimal_data_chunks(data, minimum=OPTIMIZE_MINIMUM))
+    version = fit_version(chunks, error_correction)
+    codewords = util.create_data(version, error_correction, chunks)
+
+    blank, order, masks = get_template(version)
+    bits = np.zeros(len(order[0]), dtype=bool)
+    data_bits = np.unpackbits(np.frombuffer(bytes(codewords), dtype=np.uint8)).astype(bool)
+    bits[:min(len(bits), len(data_bits))] = data_bits[:len(bits)]
+
+    candidates = np.repeat(blank[np.newaxis], 8, axis=0)
+    candidates[:, order[0], order[1]] = bits ^ masks
+    # argmin keeps the first of equal scores, like QRCode.best_mask_pattern
+    mask_pattern = int(np.argmin(lost_points(candidates)))
+
+    matrix = candidates[mask_pattern]
+    count = matrix.shape[0]
+    type_bits = util.BCH_type_info((error_correction << 3) | mask_pattern)
+    matrix[format_positions(count)] = [(type_bits >> i) & 1 == 1 for i in range(15)] * 2
+    if version >= 7:
+        number_bits = util.BCH_type_number(version)
+        matrix[version_positions(count)] = [(number_bits >> i) & 1 == 1 for i in range(18)] * 2
+    matrix[count - 8, 8] = True
+    return matrix
+
+
+def encode_wifi(ssid, password, error_correction=constants.ERROR_CORRECT_M):
+    """Encodes the dashboard's Wi-Fi payload with the fast path."""
+    return encode(wifi_qr_payload(ssid, password), error_correction)
@@ -0,0 +1,170 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QPixmap
+import metrics
+
+# Frames kept ready around the one on screen; with this many networks or
+# fewer, every frame stays rendered.
+RING_SIZE = 6
+# Render threads; the GUI thread keeps a core to itself on a Pi 4
+RENDER_THREADS = 2
+# Wait before rendering a frame again after it failed
+RETRY_DELAY_MS = 5000
+
+
+def render_qr_image(ssid, password, error_correction, size, border):
+    """Encodes and rasterizes one network's QR code. Safe to call off the GUI thread."""
+    from qr_encoder import encode_wifi
+    from qr_render import render_qr_matrix
+
+    with metrics.span("qr.encode"):
+        modules = encode_wifi(ssid, password, error_correction)
+    # Draw the modules directly at an integer scale that fits size
+    with metrics.span("qr.rasterize", modules=len(modules), size=size):
+        return render_qr_matrix(modules, size, border=border)
+
+
+class _RenderSignals(QObject):
+    # (cache key, QImage, whether it came from the disk cache)
+    rendered = pyqtSignal(str, object, bool)
+    # (cache key, error message)
+    failed = pyqtSignal(str, str)
+
+
+# Produces one QR frame on a pool thread: from the disk cache if it is
+# there, otherwise rendered and written back to it. Only QImage is used off
+# the GUI thread; the QPixmap is made when the result arrives.
+class _RenderTask(QRunnable):
+    def __init__(self, signals, cache, key, network, error_correction, size, border):
+        super().__init__()
+        self.signals = signals
+        self.cache = cache
+        self.key = key
+        self.network = network
+        self.error_correction = error_correction
+        self.size = size
+        self.border = border
+
+    def run(self):
+        try:
+            image = self.cache.load_image(self.key)
+            from_disk = image is not None
+            if not from_disk:
+                with metrics.span("qr.render"):
+                    image = render_qr_image(*self.network, self.error_correction, self.size, self.border)
+                self.cache.write_to_disk(self.key, image)
+        except Exception as e:
+            self.signals.failed.emit(self.key, str(e))
+            return
+        self.signals.rendered.emit(self.key, image, from_disk)
+
+
+# A bounded ring of ready-to-show QR pixmaps for the dashboard's networks.
+# Frames for the current network and the next RING_SIZE - 1 are kept;
+# missing ones are rendered on a thread pool and announced through
+# frame_ready, so moving to a prepared frame is only a pixmap swap.
+class QRFrameRing(QObject):
+    # Emitted with the network index whose frame has become available
+    frame_ready = pyqtSignal(int)
+    # Emitted with the network index whose frame could not be rendered
+    frame_failed = pyqtSignal(int)
+
+    def __init__(self, cache, error_correction, size, border, ring_size=RING_SIZE, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.error_correction = error_correction
+        self.size = size
+        self.border = border
+        self.ring_size = ring_size
+        self.networks = []
+        self.keys = []
+        self.current = 0
+        # Cache key -> QPixmap for the frames in the window
+        self.frames = {}
+        self.pending = set()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(RENDER_THREADS)
+        self.signals = _RenderSignals(self)
+        self.signals.rendered.connect(self.frame_rendered)
+        self.signals.failed.connect(self.render_failed)
+
+    def set_networks(self, networks, current=0):
+        """Replaces the networks, keeping frames of any that are still listed."""
+        self.networks = list(networks)
+        self.keys = [
+            self.cache.make_key(ssid, password, self.error_correction, self.size)
+            for ssid, password in self.networks
+        ]
+        self.prefetch(current)
+
+    def window(self, current):
+        """Cache keys of the frames to keep ready when current is on screen."""
+        count = len(self.keys)
+        return {self.keys[(current + offset) % count] for offset in range(min(count, self.ring_size))}
+
+    def prefetch(self, current):
+        """Drops frames outside the window around current and starts rendering missing ones."""
+        self.current = current
+        if not self.keys:
+            self.frames.clear()
+            return
+        wanted = self.window(current)
+        for key in list(self.frames):
+            if key not in wanted:
+                del self.frames[key]
+        for offset in range(min(len(self.keys), self.ring_size)):
+            index = (current + offset) % len(self.keys)
+            key = self.keys[index]
+            if key in self.frames or key in self.pending:
+                continue
+            pixmap = self.cache.get_memory(key)
+            if pixmap is not None:
+                self.frames[key] = pixmap
+                self.cache.report()
+                continue
+            self.pending.add(key)
+            self.pool.start(_RenderTask(
+                self.signals, self.cache, key, self.networks[index],
+                self.error_correction, self.size, self.border,
+            ))
+
+    def frame(self, index):
+        """Returns the pixmap for a network index, or None if it is not ready yet."""
+        if not self.keys:
+            return None
+        return self.frames.get(self.keys[index])
+
+    def frame_rendered(self, key, image, from_disk):
+        self.pending.discard(key)
+        if from_disk:
+            self.cache.count_disk_hit()
+        else:
+            self.cache.count_miss()
+        self.cache.report()
+        with metrics.span("qr.to_pixmap"):
+            pixmap = QPixmap.fromImage(image)
+        self.cache.remember(key, pixmap)
+        if not self.keys or key not in self.window(self.current):
+            # The networks or the window moved on while it was rendering
+            return
+        self.frames[key] = pixmap
+        for index, frame_key in enumerate(self.keys):
+            if frame_key == key:
+                self.frame_ready.emit(index)
+
+    def render_failed(self, key, error):
+        self.pending.discard(key)
+        print(f"Error rendering QR code: {error}")
+        if not self.keys or key not in self.window(self.current):
+            return
+        for index, frame_key in enumerate(self.keys):
+            if frame_key == key:
+                self.frame_failed.emit(index)
+        # Try again later unless the window has moved on by then
+        QTimer.singleShot(RETRY_DELAY_MS, self.retry)
+
+    def retry(self):
+        self.prefetch(self.current)
+
+    def wait(self):
+        """Blocks until every queued render has finished, e.g. before exiting."""
+        self.pool.waitForDone()
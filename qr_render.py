@@ -0,0 +1,37 @@
+import numpy as np
+
+# Rasterizes a QR module matrix straight into 8-bit grayscale pixels. Each
+# module becomes a solid square of an integer number of pixels, so the
+# edges stay sharp and there is no intermediate PIL image or resample step.
+# Only render_qr_matrix needs Qt; the card exporter uses the NumPy helpers.
+
+
+def qr_layout(module_count, target_size, border=2):
+    """Returns (module count with quiet zone, pixels per module) that fit target_size."""
+    count = module_count + 2 * border
+    return count, max(1, target_size // count)
+
+
+def qr_matrix_pixels(modules, target_size, border=2):
+    """
+    Returns a square uint8 array of the QR code no larger than target_size
+    pixels, using the largest integer module scale that fits.
+    """
+    dark = np.asarray(modules, dtype=bool)
+    count, scale = qr_layout(dark.shape[0], target_size, border)
+
+    # Quiet zone is white (255), dark modules are black (0)
+    pixels = np.full((count, count), 255, dtype=np.uint8)
+    pixels[border:border + dark.shape[0], border:border + dark.shape[1]][dark] = 0
+    return np.repeat(np.repeat(pixels, scale, axis=0), scale, axis=1)
+
+
+def render_qr_matrix(modules, target_size, border=2):
+    """Returns the QR code as a QImage, drawn like qr_matrix_pixels."""
+    from PyQt5.QtGui import QImage
+
+    pixels = qr_matrix_pixels(modules, target_size, border)
+    side = pixels.shape[0]
+    image = QImage(pixels.data, side, side, side, QImage.Format_Grayscale8)
+    # QImage does not own the NumPy buffer; copy before it goes out of scope
+    return image.copy()
@@ -0,0 +1,14 @@
+# QR settings shared by the dashboard and the card export. This module
+# imports nothing, so reading them does not pull qrcode (and PIL) into
+# the kiosk's startup path.
+
+# Error correction levels, with the values qrcode.constants gives them
+ERROR_CORRECT_L = 1
+ERROR_CORRECT_M = 0
+ERROR_CORRECT_Q = 3
+ERROR_CORRECT_H = 2
+
+# Every rendered Wi-Fi QR code uses these; they are part of the QR cache key
+QR_ERROR_CORRECTION = ERROR_CORRECT_M
+# Quiet zone around the code, in modules
+QR_BORDER = 2
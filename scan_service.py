@@ -0,0 +1,179 @@
+import os
+import json
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+import metrics
+from command_runner import shared_runner
+from wifi_scan import NMCLI_FIELDS, Network, parse_scan_output
+
+# Last scan results, shown on the next start; WIPI_SCAN_SNAPSHOT overrides it
+SCAN_SNAPSHOT_PATH = "/home/pi/wi-pi-demo/scan_snapshot.json"
+
+# Background rescan interval: starts at the base, doubles while results stay
+# the same and drops back to the base when something changes. Failed scans
+# are retried on their own, shorter exponential backoff.
+BASE_INTERVAL_MS = 30 * 1000
+MAX_INTERVAL_MS = 5 * 60 * 1000
+RETRY_INTERVAL_MS = 5 * 1000
+SCAN_TIMEOUT_MS = 15 * 1000
+
+
+def nmcli_command(rescan):
+    """Builds the nmcli listing command; rescan=False only reads NetworkManager's cache."""
+    return [
+        "nmcli", "-t", "-f", NMCLI_FIELDS, "device", "wifi", "list",
+        "--rescan", "yes" if rescan else "no",
+    ]
+
+
+def visible_networks(networks):
+    """
+    What the list shows a user: which SSIDs are around and whether they
+    need a password. Signal strength moves on nearly every scan, so it is
+    left out of the decision to back off or rewrite the snapshot.
+    """
+    return {(network.ssid, network.secured) for network in networks}
+
+
+# Owns Wi-Fi scanning for the selector screen. Cached results are shown
+# first, real rescans run in the background on an adaptive schedule, and
+# overlapping requests are merged into the one scan already in flight.
+class ScanService(QObject):
+    # Emitted with a list of wifi_scan.Network, strongest first
+    results_ready = pyqtSignal(list)
+    scan_failed = pyqtSignal(str)
+
+    def __init__(self, snapshot_path=None, runner=None, parent=None):
+        super().__init__(parent)
+        self.snapshot_path = snapshot_path or os.environ.get("WIPI_SCAN_SNAPSHOT") or SCAN_SNAPSHOT_PATH
+        self.runner = runner or shared_runner()
+        self.networks = []
+        # Visible networks as last written to the snapshot file
+        self.snapshot_visible = set()
+        self.in_flight = False
+        self.rescan_pending = False
+        self.started = False
+        self.active = False
+        self.interval_ms = BASE_INTERVAL_MS
+        self.failures = 0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(lambda: self.run_scan(rescan=True))
+
+    def start(self):
+        """Publishes cached results straight away, then starts background scanning."""
+        # The selector can be shown twice before its first paint
+        if self.started:
+            return
+        self.started = True
+        self.active = True
+        snapshot = self.load_snapshot()
+        self.snapshot_visible = visible_networks(snapshot)
+        if snapshot:
+            self.networks = snapshot
+            self.results_ready.emit(snapshot)
+        # NetworkManager's own cache is cheap to read; a real rescan follows it
+        self.run_scan(rescan=False)
+        self.rescan_pending = True
+
+    def resume(self):
+        """Restarts scheduled rescans, beginning with an immediate one."""
+        if self.active or not self.started:
+            return
+        self.active = True
+        self.request_scan()
+
+    def pause(self):
+        """Stops scheduled rescans while nobody is looking at the list."""
+        self.active = False
+        self.timer.stop()
+
+    def request_scan(self):
+        """Requests a real rescan now, merging it into one already in flight."""
+        self.interval_ms = BASE_INTERVAL_MS
+        if self.in_flight:
+            self.rescan_pending = True
+            return
+        self.run_scan(rescan=True)
+
+    def run_scan(self, rescan):
+        self.in_flight = True
+        self.timer.stop()
+        span = metrics.span("scan.nmcli", rescan=rescan)
+        self.runner.run(
+            nmcli_command(rescan),
+            on_finished=lambda result: self.scan_done(result, rescan, span),
+            timeout_ms=SCAN_TIMEOUT_MS,
+        )
+
+    def scan_done(self, result, rescan, span):
+        span.stop(ok=result.ok, timed_out=result.timed_out)
+        if not result.ok:
+            reason = result.error or ("timed out" if result.timed_out else "failed")
+            stderr = result.stderr.decode(errors="ignore").strip()
+            print(f"nmcli error: {reason} (exit {result.exit_code}): {stderr or 'no error output'}")
+            metrics.count("scan.failures")
+            self.finish_scan(None, rescan)
+            return
+        with metrics.span("scan.parse", bytes=len(result.stdout)):
+            networks = parse_scan_output(result.stdout.decode(errors="ignore"))
+        self.finish_scan(networks, rescan)
+
+    def finish_scan(self, networks, rescan):
+        """Publishes a finished scan and schedules the next one."""
+        self.in_flight = False
+        if networks is None:
+            self.failures += 1
+            self.scan_failed.emit("Error scanning for networks.")
+            delay = min(RETRY_INTERVAL_MS * 2 ** (self.failures - 1), MAX_INTERVAL_MS)
+        else:
+            self.failures = 0
+            changed = visible_networks(networks) != visible_networks(self.networks)
+            if networks != self.networks:
+                # Signal-only changes still reach the list, but do not count as news
+                self.networks = networks
+                self.results_ready.emit(networks)
+            if changed:
+                metrics.count("scan.changed")
+                if rescan:
+                    self.interval_ms = BASE_INTERVAL_MS
+            elif rescan:
+                metrics.count("scan.unchanged")
+                self.interval_ms = min(self.interval_ms * 2, MAX_INTERVAL_MS)
+            delay = self.interval_ms
+            # Compared with the file, not self.networks: the cached read at
+            # start already updated those without saving them
+            if rescan and visible_networks(networks) != self.snapshot_visible:
+                if self.save_snapshot(networks):
+                    self.snapshot_visible = visible_networks(networks)
+
+        if self.rescan_pending:
+            self.rescan_pending = False
+            self.run_scan(rescan=True)
+        elif self.active:
+            self.timer.start(delay)
+
+    def load_snapshot(self):
+        """Loads the networks persisted by the last successful rescan."""
+        try:
+            with open(self.snapshot_path, "r") as f:
+                return [Network(**entry) for entry in json.load(f)]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"Error loading scan snapshot: {e}")
+            return []
+
+    def save_snapshot(self, networks):
+        """
+        Persists the networks with an atomic rename so a crash never leaves
+        half a file. Returns False on failure.
+        """
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump([network._asdict() for network in networks], f)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            print(f"Error saving scan snapshot: {e}")
+            return False
+        return True
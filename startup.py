@@ -0,0 +1,24 @@
+from PyQt5.QtCore import QObject, QEvent, QTimer
+
+# Helpers for keeping secondary work out of the way of the first frame.
+
+
+class _FirstPaintFilter(QObject):
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self.widget = widget
+        self.callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QEvent.Paint:
+            self.widget.removeEventFilter(self)
+            # Run once the paint has been flushed, not from inside it
+            QTimer.singleShot(0, self.callback)
+            self.deleteLater()
+        return False
+
+
+def after_first_paint(widget, callback):
+    """Calls callback once, right after widget has painted for the first time."""
+    _FirstPaintFilter(widget, callback)
@@ -0,0 +1,81 @@
+from typing import NamedTuple
+
+# Fields requested from `nmcli -t device wifi list`, in output order.
+NMCLI_FIELDS = "SSID,SECURITY,SIGNAL,BSSID,CHAN,FREQ"
+
+
+# One access point as reported by nmcli. After parsing, each SSID is
+# represented by its strongest BSSID.
+class Network(NamedTuple):
+    ssid: str
+    security: str
+    signal: int
+    bssid: str
+    channel: int
+    frequency: int
+
+    @property
+    def secured(self):
+        # nmcli prints "--" or an empty field for open networks
+        return self.security not in ("", "--")
+
+
+def split_terse_line(line):
+    """
+    Splits one line of nmcli terse output into fields. In terse mode nmcli
+    escapes ':' and '\\' inside values with a backslash.
+    """
+    if "\\" not in line:
+        return line.split(":")
+
+    fields = []
+    current = []
+    escaped = False
+    for char in line:
+        if escaped:
+            current.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == ":":
+            fields.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    fields.append("".join(current))
+    return fields
+
+
+def parse_int(value):
+    """Parses the leading integer of a field such as '2437 MHz', or returns 0."""
+    digits = value.split(" ", 1)[0]
+    return int(digits) if digits.isdigit() else 0
+
+
+def parse_scan_output(output):
+    """
+    Parses `nmcli -t -f SSID,SECURITY,SIGNAL,BSSID,CHAN,FREQ` output into a
+    list of Networks, one per SSID (its strongest BSSID), strongest first.
+    """
+    strongest = {}
+    for line in output.splitlines():
+        if not line:
+            continue
+        fields = split_terse_line(line)
+        if len(fields) < 6:
+            fields += [""] * (6 - len(fields))
+        ssid = fields[0].strip()
+        if not ssid:
+            continue
+        network = Network(
+            ssid=ssid,
+            security=fields[1],
+            signal=parse_int(fields[2]),
+            bssid=fields[3],
+            channel=parse_int(fields[4]),
+            frequency=parse_int(fields[5]),
+        )
+        best = strongest.get(ssid)
+        if best is None or network.signal > best.signal:
+            strongest[ssid] = network
+    return sorted(strongest.values(), key=lambda network: network.signal, reverse=True)
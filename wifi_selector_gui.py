@@ -1,24 +1,28 @@
 import sys
-import subprocess
-import json
-import threading
-import os
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QDialog, QLineEdit, QHBoxLayout,
-    QStackedWidget,
+    QListView, QDialog, QLineEdit, QHBoxLayout, QStackedWidget,
 )
-from PyQt5.QtGui import QFont, QIcon, QPixmap
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from main_screen import MainScreen
+from login_screen import LoginScreen
+from network_model import NetworkListModel, SecuredRole
+from scan_service import ScanService
+from onscreen_keyboard import OnScreenKeyboard
+from credential_store import shared_store
+from assets import shared_assets, LIST_ICON_SIZE, SELECTOR_LOGO_SIZE
+from startup import after_first_paint
+import metrics
 
-# This class represents the password input dialog box.
+# This class represents the password input dialog box. It carries its own
+# on-screen keyboard and is reused for every secured network.
 class PasswordPrompt(QDialog):
-    def __init__(self, ssid):
+    def __init__(self, ssid=""):
         super().__init__()
-        self.setWindowTitle(f"Enter Password for {ssid}")
-        self.setFixedSize(300, 150)
-        # Place in upper area so it doesn't overlap keyboard
-        self.move(250, 50)
+        self.setFixedSize(700, 420)
+        # Place in upper area of the portrait screen
+        self.move(10, 50)
         self.setStyleSheet("background-color: #2b2b2b; color: white;")
         
         # This line is added to make the dialog application modal,
@@ -27,9 +31,9 @@ class PasswordPrompt(QDialog):
         self.setWindowFlags(Qt.WindowStaysOnTopHint)
 
         layout = QVBoxLayout()
-        label = QLabel(f"Password for {ssid}:")
-        label.setFont(QFont("Arial", 12))
-        layout.addWidget(label)
+        self.label = QLabel()
+        self.label.setFont(QFont("Arial", 12))
+        layout.addWidget(self.label)
 
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.Password)
@@ -72,7 +76,19 @@ class PasswordPrompt(QDialog):
         btns.addWidget(cancel_btn)
         layout.addLayout(btns)
 
+        # On-screen keyboard typing straight into the password field
+        self.keyboard = OnScreenKeyboard(self.password_input)
+        layout.addWidget(self.keyboard)
+
         self.setLayout(layout)
+        self.set_ssid(ssid)
+
+    def set_ssid(self, ssid):
+        """Prepares the prompt for a network, clearing any previous input."""
+        self.setWindowTitle(f"Enter Password for {ssid}")
+        self.label.setText(f"Password for {ssid}:")
+        self.password_input.clear()
+        self.keyboard.reset()
 
     def get_password(self):
         return self.password_input.text().strip()
@@ -85,11 +101,14 @@ class WifiSelectorScreen(QWidget):
     def __init__(self):
         super().__init__()
         self.setStyleSheet("background-color: #1e1e1e; color: white;")
-        self.secured_networks = {}
+        self.network_model = NetworkListModel(self)
+        self.scan_service = ScanService(parent=self)
+        self.scan_service.results_ready.connect(self.apply_scan_results)
+        self.scan_service.scan_failed.connect(self.show_scan_error)
+        # Built on the first secured network and reused afterwards
+        self.password_prompt = None
         
         self.setup_ui()
-        # Start scanning in a background thread
-        threading.Thread(target=self.scan_networks, daemon=True).start()
 
     def setup_ui(self):
         """Sets up the user interface elements."""
@@ -99,11 +118,9 @@ class WifiSelectorScreen(QWidget):
 
         # Wi-Pi Logo (guard if file missing)
         logo = QLabel()
-        logo_path = "/home/pi/wi-pi-demo/icons/wi-pi-logo.png"
-        if os.path.exists(logo_path):
-            pm = QPixmap(logo_path).scaled(120, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            if not pm.isNull():
-                logo.setPixmap(pm)
+        pm = shared_assets().pixmap("wi-pi-logo.png", SELECTOR_LOGO_SIZE)
+        if not pm.isNull():
+            logo.setPixmap(pm)
         logo.setAlignment(Qt.AlignCenter)
         layout.addWidget(logo)
 
@@ -113,14 +130,24 @@ class WifiSelectorScreen(QWidget):
         header.setAlignment(Qt.AlignLeft)
         layout.addWidget(header)
 
+        # Scan status, only shown when something went wrong
+        self.status_label = QLabel()
+        self.status_label.setFont(QFont("Arial", 12))
+        self.status_label.hide()
+        layout.addWidget(self.status_label)
+
         # Wi-Fi List
-        self.network_list = QListWidget()
+        self.network_list = QListView()
+        self.network_list.setModel(self.network_model)
+        self.network_list.setUniformItemSizes(True)
+        # Lock icons are pre-scaled to exactly this size
+        self.network_list.setIconSize(LIST_ICON_SIZE)
         self.network_list.setStyleSheet(
-            "QListWidget { background-color: #2b2b2b; border: 2px solid #3d3d3d; border-radius: 10px; padding: 5px; }"
-            "QListWidget::item { background-color: #2b2b2b; color: white; padding: 8px; border-bottom: 1px solid #3d3d3d; }"
-            "QListWidget::item:selected { background-color: #007BFF; }"
+            "QListView { background-color: #2b2b2b; border: 2px solid #3d3d3d; border-radius: 10px; padding: 5px; }"
+            "QListView::item { background-color: #2b2b2b; color: white; padding: 8px; border-bottom: 1px solid #3d3d3d; }"
+            "QListView::item:selected { background-color: #007BFF; }"
         )
-        self.network_list.itemClicked.connect(self.select_network)
+        self.network_list.clicked.connect(self.select_network)
         layout.addWidget(self.network_list)
         
         # Refresh button
@@ -139,78 +166,59 @@ class WifiSelectorScreen(QWidget):
             }
         """)
         refresh_button.setFixedHeight(50) 
-        refresh_button.clicked.connect(lambda: threading.Thread(target=self.scan_networks, daemon=True).start())
+        refresh_button.clicked.connect(self.scan_networks)
         layout.addWidget(refresh_button)
 
         self.setLayout(layout)
 
     def scan_networks(self):
         """
-        Scans for Wi-Fi networks using the `nmcli` command and populates the list.
+        Asks the scan service for a fresh scan. Presses while a scan is
+        already running are merged into it.
         """
-        try:
-            result = subprocess.run(
-                ["nmcli", "-t", "-f", "SSID,SECURITY", "device", "wifi", "list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=False,
-                timeout=15,
-            )
-            output = result.stdout.decode(errors="ignore")
-        except Exception as e:
-            print(f"nmcli error: {e}")
-            self.network_list.clear()
-            self.network_list.addItem("Error scanning for networks.")
-            return
+        self.scan_service.request_scan()
+
+    def apply_scan_results(self, networks):
+        """Applies a finished scan to the list model as a diff."""
+        self.status_label.hide()
+        with metrics.span("scan.list_update", networks=len(networks)):
+            self.network_model.apply_networks(networks)
 
-        self.secured_networks.clear()
-        self.network_list.clear()
-        seen = set()
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split(":")
-            ssid = parts[0].strip()
-            security = parts[1] if len(parts) > 1 else ""
-            if not ssid or ssid in seen:
-                continue
-            seen.add(ssid)
-            
-            # Use the original icon logic
-            lock_icon_path = "/home/pi/wi-pi-demo/icons/lock.png"
-            unlock_icon_path = "/home/pi/wi-pi-demo/icons/unlock.png"
-            icon_path = lock_icon_path if security else unlock_icon_path
-            icon = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
-            
-            item = QListWidgetItem(icon, ssid)
-            self.network_list.addItem(item)
-            self.secured_networks[ssid] = bool(security)
-
-    def select_network(self, item):
+    def show_scan_error(self, message):
+        self.status_label.setText(message)
+        self.status_label.show()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.scan_service.started:
+            self.scan_service.resume()
+        else:
+            # Show cached networks and start rescanning once the screen is up
+            after_first_paint(self, self.scan_service.start)
+
+    def hideEvent(self, event):
+        # Stop background rescans while another screen is in front
+        super().hideEvent(event)
+        self.scan_service.pause()
+
+    def select_network(self, index):
         """
         Handles network selection, prompts for a password if needed,
         and then emits a signal with the data.
         """
-        selected_ssid = item.text()
+        selected_ssid = index.data(Qt.DisplayRole)
         print(f"Selected: {selected_ssid}")
 
-        is_secured = self.secured_networks.get(selected_ssid, False)
+        is_secured = index.data(SecuredRole)
         password = ""
 
         if is_secured:
-            # Launch on-screen keyboard at bottom while prompt is open
-            try:
-                kb_proc = subprocess.Popen(["matchbox-keyboard", "-geometry", "800x160+0+320"])
-            except FileNotFoundError:
-                print("matchbox-keyboard not found. Skipping keyboard launch.")
-                kb_proc = None
-
-            prompt = PasswordPrompt(selected_ssid)
+            if self.password_prompt is None:
+                self.password_prompt = PasswordPrompt()
+            prompt = self.password_prompt
+            prompt.set_ssid(selected_ssid)
             prompt.password_input.setFocus()
             result = prompt.exec_()
-            
-            if kb_proc:
-                kb_proc.terminate()
 
             if result == QDialog.Accepted:
                 password = prompt.get_password()
@@ -222,55 +230,53 @@ class WifiSelectorScreen(QWidget):
         # Emit signal to trigger the next step in the main manager
         self.network_selected.emit(selected_ssid, password)
 
-# A new screen to show that the next script is launching.
+# A screen shown while the selected network is saved and the dashboard opens.
 class LaunchScreen(QWidget):
-    # Removed the go_back signal as it is no longer needed.
-    def __init__(self, ssid, password):
+    # Emitted once the network info has been written to disk.
+    saved = pyqtSignal()
+
+    def __init__(self):
         super().__init__()
-        self.ssid = ssid
-        self.password = password
+        self.ssid = ""
+        self.password = ""
         self.setup_ui()
-        # Launch the main_screen.py script after a short delay or immediately
-        self.save_and_launch()
 
     def setup_ui(self):
         """Sets up the UI for the launch screen."""
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignCenter)
         
-        message_label = QLabel(f"Network info for '{self.ssid}' saved.")
-        message_label.setFont(QFont("Arial", 16))
-        message_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(message_label)
+        self.message_label = QLabel()
+        self.message_label.setFont(QFont("Arial", 16))
+        self.message_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.message_label)
         
-        launch_label = QLabel("Launching main_screen.py...")
+        launch_label = QLabel("Opening dashboard...")
         launch_label.setFont(QFont("Arial", 16, QFont.Bold))
         launch_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(launch_label)
 
         self.setLayout(layout)
 
+    def set_network(self, ssid, password):
+        """Points the screen at a newly selected network and saves it."""
+        self.ssid = ssid
+        self.password = password
+        self.message_label.setText(f"Network info for '{self.ssid}' saved.")
+        self.save_and_launch()
+
     def save_and_launch(self):
-        """Saves network info to a JSON file and launches the main screen."""
-        wifi_data = {
-            "wifi_name": self.ssid,
-            "wifi_password": self.password,
-        }
-        try:
-            with open("/home/pi/wi-pi-demo/selected_network.json", "w") as f:
-                json.dump(wifi_data, f)
-            print("âœ… Network info saved. Launching main_screen.py...")
-        except Exception as e:
-            print(f"Error saving network info: {e}")
+        """Saves network info to the credential store and asks for the dashboard."""
+        if not shared_store().save(self.ssid, self.password):
+            self.message_label.setText("Error saving network info.")
             return
+        print("âœ… Network info saved. Opening dashboard...")
 
-        # Launch main_screen.py
-        try:
-            subprocess.Popen(["python3", "/home/pi/wi-pi-demo/main_screen.py"])
-        except FileNotFoundError:
-            print("Error: main_screen.py not found. Please ensure the path is correct.")
+        self.saved.emit()
 
-# This class manages the different Wi-Fi screens using a stacked widget.
+# This class is the single long-lived app shell. Every screen is created
+# once, added to the stacked widget and reused, so switching screens is a
+# page flip instead of a new Python process.
 class WifiManager(QWidget):
     def __init__(self):
         super().__init__()
@@ -281,30 +287,81 @@ class WifiManager(QWidget):
         
         self.stacked_widget = QStackedWidget()
         self.selector_screen = WifiSelectorScreen()
-        
         self.stacked_widget.addWidget(self.selector_screen)
+        # The other screens are built on first use and reused afterwards
+        self._launch_screen = None
+        self._dashboard_screen = None
+        self._login_screen = None
         
         # Connect signals from the selector screen
         self.selector_screen.network_selected.connect(self.show_launch_screen)
 
         main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(self.stacked_widget)
         self.setLayout(main_layout)
 
+        # Scale the remaining icons and logos while the first screen is idle
+        after_first_paint(self, shared_assets().preload)
+
+    @property
+    def launch_screen(self):
+        if self._launch_screen is None:
+            self._launch_screen = LaunchScreen()
+            # Let the launch screen paint once before the dashboard replaces it
+            self._launch_screen.saved.connect(lambda: QTimer.singleShot(0, self.show_dashboard))
+            self.stacked_widget.addWidget(self._launch_screen)
+        return self._launch_screen
+
+    @property
+    def dashboard_screen(self):
+        if self._dashboard_screen is None:
+            self._dashboard_screen = MainScreen()
+            self._dashboard_screen.login_requested.connect(self.show_login)
+            self.stacked_widget.addWidget(self._dashboard_screen)
+        return self._dashboard_screen
+
+    @property
+    def login_screen(self):
+        if self._login_screen is None:
+            self._login_screen = LoginScreen()
+            self._login_screen.login_succeeded.connect(self.show_selector)
+            self._login_screen.cancelled.connect(self.show_dashboard)
+            self.stacked_widget.addWidget(self._login_screen)
+        return self._login_screen
+
+    def show_selector(self):
+        """Switches to the Wi-Fi selector screen."""
+        with metrics.span("screen.switch", screen="selector"):
+            self.setWindowTitle("Wi-Pi | Admin Dashboard")
+            self.stacked_widget.setCurrentWidget(self.selector_screen)
+
     def show_launch_screen(self, ssid, password):
-        """Creates and displays the launch screen."""
-        launch_screen = LaunchScreen(ssid, password)
-        
-        # Removed the signal connection for the go_back button.
-        # launch_screen.go_back.connect(lambda: self.stacked_widget.setCurrentIndex(0))
+        """Saves the selected network and displays the launch screen."""
+        with metrics.span("screen.switch", screen="launch"):
+            self.stacked_widget.setCurrentWidget(self.launch_screen)
+            self.launch_screen.set_network(ssid, password)
+
+    def show_dashboard(self):
+        """Switches to the QR dashboard, re-reading the selected network."""
+        with metrics.span("screen.switch", screen="dashboard"):
+            self.setWindowTitle("Wi-Pi | Dashboard")
+            self.dashboard_screen.refresh()
+            self.stacked_widget.setCurrentWidget(self.dashboard_screen)
 
-        # Add the new screen to the stacked widget and display it
-        self.stacked_widget.addWidget(launch_screen)
-        self.stacked_widget.setCurrentWidget(launch_screen)
+    def show_login(self):
+        """Switches to the admin login screen."""
+        with metrics.span("screen.switch", screen="login"):
+            self.setWindowTitle("Wi-Pi | Login")
+            self.login_screen.reset()
+            self.stacked_widget.setCurrentWidget(self.login_screen)
 
+def create_window():
+    """Builds the kiosk shell with the Wi-Fi selector in front."""
+    return WifiManager()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = WifiManager()
+    window = create_window()
     window.show()
     sys.exit(app.exec_())
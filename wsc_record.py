@@ -0,0 +1,45 @@
+import ndef
+
+# Builds the Wi-Fi Simple Config credential record
+# (application/vnd.wfa.wsc) that Android treats as a native Wi-Fi handover.
+# ndeflib does the TLV encoding; this only checks the lengths the spec
+# allows, which ndeflib does not.
+
+WSC_VERSION = 0x10
+# The credential applies to any access point with the SSID
+BROADCAST_MAC = b"\xff" * 6
+
+MAX_SSID_BYTES = 32
+MIN_KEY_BYTES = 8
+MAX_KEY_BYTES = 64
+
+
+def wsc_record(ssid, password):
+    """
+    Returns an NDEF record carrying a WPA2-Personal credential, or an open
+    network when the password is empty. Raises ValueError for lengths the
+    spec rejects.
+    """
+    ssid_bytes = ssid.encode("utf-8")
+    key_bytes = password.encode("utf-8")
+    if not 0 < len(ssid_bytes) <= MAX_SSID_BYTES:
+        raise ValueError(f"SSID must be 1..{MAX_SSID_BYTES} bytes, got {len(ssid_bytes)}")
+    if key_bytes and not MIN_KEY_BYTES <= len(key_bytes) <= MAX_KEY_BYTES:
+        raise ValueError(f"Network key must be {MIN_KEY_BYTES}..{MAX_KEY_BYTES} bytes, got {len(key_bytes)}")
+
+    credential = ndef.wifi.Credential()
+    credential.set_attribute("network-index", 1)
+    credential.set_attribute("ssid", ssid_bytes)
+    if key_bytes:
+        credential.set_attribute("authentication-type", "WPA2-Personal")
+        credential.set_attribute("encryption-type", "AES")
+    else:
+        credential.set_attribute("authentication-type", "Open")
+        credential.set_attribute("encryption-type", "None")
+    credential.set_attribute("network-key", key_bytes)
+    credential.set_attribute("mac-address", BROADCAST_MAC)
+
+    record = ndef.WifiSimpleConfigRecord()
+    record.set_attribute("version-1", WSC_VERSION)
+    record.set_attribute("credential", credential)
+    return record